@@ -13,13 +13,23 @@ import asyncio
 from datetime import datetime
 
 from core.state import session_store
-from core.conversation import orchestrator
+from core.conversation import orchestrator, ConversationResponse
 from services.user_intelligence import user_intelligence
 
 logger = logging.getLogger("samaira.chat")
 
 router = APIRouter()
 
+# SSE frame for one streamed text chunk. Byte-identical to
+# json.dumps({"type": "content", "text": chunk}), but only the chunk string is
+# encoded per token instead of building and encoding a dict.
+_SSE_CONTENT_PREFIX = 'data: {"type": "content", "text": '
+
+
+def _sse_content(chunk: str) -> str:
+    """Format a streamed text chunk as an SSE content event."""
+    return _SSE_CONTENT_PREFIX + json.dumps(chunk) + "}\n\n"
+
 
 class ChatRequest(BaseModel):
     """Request body for chat endpoint."""
@@ -204,29 +214,22 @@ async def chat_stream(request: ChatRequest):
     history_count = len(session.conversation_history)
     print(f"[CHAT] Session: {session.session_id[:8]}... | User: {session.user_name or 'Unknown'} | History: {history_count} msgs")
     
-    # Import LLM service for streaming
-    from services.llm_service import llm_service
-    from core.intent import detect_intent
-    
     async def generate():
         try:
             # Send session info first
             yield f"data: {json.dumps({'type': 'session', 'session_id': session.session_id})}\n\n"
             
-            # Detect intent for suggestions
-            intent_result = detect_intent(request.message)
-            
-            # Stream directly from LLM (user info extraction happens inside groq_client now)
-            full_response = ""
-            async for chunk in llm_service.chat_stream(request.message, session):
-                full_response += chunk
-                yield f"data: {json.dumps({'type': 'content', 'text': chunk})}\n\n"
+            # Stream through the orchestrator (safety, context, intro stripping, disclaimers);
+            # it also records the turn in the session and finishes with the
+            # full response, whose intent drives the suggestions
+            result = None
+            async for chunk in orchestrator.process_message_stream(request.message, session):
+                if isinstance(chunk, ConversationResponse):
+                    result = chunk
+                    continue
+                yield _sse_content(chunk)
                 await asyncio.sleep(0.01)
             
-            # Update session with the conversation (only place this happens now)
-            session.add_message("user", request.message)
-            session.add_message("assistant", full_response)
-            
             # PERSIST session to disk
             session_store.update_session(session)
             
@@ -235,10 +238,10 @@ async def chat_stream(request: ChatRequest):
             
             # Send metadata at the end
             from services.tts_service import tts_service
-            tts_text = tts_service.prepare_text_for_speech(full_response)
-            suggested = generate_follow_up_questions(intent_result.primary_intent.value, request.message)
+            tts_text = tts_service.prepare_text_for_speech(result.text)
+            suggested = generate_follow_up_questions(result.intent.primary_intent.value, request.message)
             
-            yield f"data: {json.dumps({'type': 'done', 'intent': intent_result.primary_intent.value, 'tts_text': tts_text, 'suggested_questions': suggested})}\n\n"
+            yield f"data: {json.dumps({'type': 'done', 'intent': result.intent.primary_intent.value, 'tts_text': tts_text, 'suggested_questions': suggested})}\n\n"
             
         except Exception as e:
             print(f"Streaming error: {e}")
@@ -439,7 +439,7 @@ async def websocket_voice_endpoint(websocket: WebSocket):
                                     }))
                                 
                                 # Clean response (strip any re-introductions) for TTS
-                                turn_number = len(session.get_conversation_history()) // 2 + 1
+                                turn_number = session.turn_count  # user message already recorded
                                 cleaned_response = clean_response(full_response, turn_number=turn_number, for_voice=True)
                                 
                                 # Add assistant response to history (use cleaned version)
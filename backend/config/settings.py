@@ -55,6 +55,11 @@ class Settings:
     # MCP Memory
     MCP_ENABLED: bool = os.getenv("MCP_ENABLED", "true").lower() == "true"
     
+    # Response cache (reuse LLM replies for repeated questions in a session; off by default)
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    RESPONSE_CACHE_SIMILARITY: float = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.9"))  # 0-1, cosine over words
+    RESPONSE_CACHE_TTL_MINUTES: int = int(os.getenv("RESPONSE_CACHE_TTL_MINUTES", "1440"))
+    
     # Paths
     BASE_DIR: Path = Path(__file__).parent.parent
     PROMPTS_DIR: Path = BASE_DIR / "prompts"
@@ -4,22 +4,25 @@ Coordinates between intent detection, safety checks, calculations, and LLM.
 Enhanced with data hub, goal interview, and knowledge base for deeper advice.
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Optional, Union, AsyncGenerator
 from dataclasses import dataclass
 
 from core.state import SessionState, GoalType, ConversationPhase
 from core.intent import detect_intent, IntentType, IntentResult
-from core.postprocess import clean_response
+from core.postprocess import clean_response, clean_stream_head
+from core.response_cache import ResponseCache, CachedResponse
 from core.safety import (
     check_safety, 
     SafetyCheckResult, 
     SafetyTriggerType,
     format_handoff_response,
     inject_disclaimer,
-    detect_projection_in_response,
-    detect_calculation_in_response
+    detect_flags_in_response
 )
 from services.llm_service import llm_service
+from config.settings import settings
 from financial.calculators import (
     calculate_sip, 
     calculate_rd, 
@@ -45,7 +48,170 @@ from core.goal_interview import goal_interview, GoalCategory
 from financial.knowledge_base import knowledge_base
 
 
-@dataclass
+# Static LLM context blurbs
+_ADVISORY_BOUNDARY_CTX = (
+    "User is asking for specific recommendations which you cannot provide. "
+    "Politely decline specific recommendations but offer to educate about "
+    "how to evaluate options themselves. Maintain warm, helpful tone."
+)
+
+_SIP_INFO_CTX = (
+    "User wants to know about SIP. Key points: "
+    "SIP = Systematic Investment Plan in mutual funds. "
+    "Can start with Rs 500/month. Rupee cost averaging benefit. "
+    "Market-linked returns (historical avg ~10-12%). "
+    "Good for long-term goals (5+ years)."
+)
+
+# RD rates come from the data hub, so only the surrounding text is fixed
+_RD_INFO_CTX_TEMPLATE = (
+    "User wants to know about RD. Key points: "
+    "RD = Recurring Deposit in bank. "
+    "Current RD rates: {rates}. "
+    "Government guarantee up to Rs 5 lakhs (DICGC). "
+    "Good for short-term goals or risk-averse users."
+)
+
+# Name mentions, in priority order: "mera naam X hai", "I am X",
+# "main X hoon", then "X speaking"
+_NAME_RES = (
+    re.compile(r"(?:mera\s+naam|my\s+name\s+is|i\s+am|main)\s+([A-Za-z]+)", re.IGNORECASE),
+    re.compile(r"([A-Za-z]+)\s+(?:bol\s+raha|speaking)", re.IGNORECASE),
+)
+_NAME_STOPWORDS = frozenset({"hai", "hoon", "hun", "the"})
+
+# Conversation phase each intent moves the session into
+_PHASE_BY_INTENT = {
+    IntentType.GREETING: ConversationPhase.GREETING,
+    IntentType.GOAL_PLANNING: ConversationPhase.GOAL_DISCOVERY,
+    IntentType.GOAL_EDUCATION: ConversationPhase.GOAL_DISCOVERY,
+    IntentType.GOAL_WEDDING: ConversationPhase.GOAL_DISCOVERY,
+    IntentType.GOAL_HOME: ConversationPhase.GOAL_DISCOVERY,
+    IntentType.GOAL_RETIREMENT: ConversationPhase.GOAL_DISCOVERY,
+    IntentType.EXPLAIN_CONCEPT: ConversationPhase.EDUCATING,
+    IntentType.SCHEME_INFO: ConversationPhase.EDUCATING,
+    IntentType.CALCULATE: ConversationPhase.CALCULATING,
+}
+
+# Intents not recorded in session.detected_intents
+_UNTRACKED_INTENTS = frozenset({IntentType.UNCLEAR, IntentType.CHITCHAT})
+
+# Characters of a streamed reply held back so a re-introduction at the
+# start can be stripped before anything reaches the client
+_STREAM_HOLDBACK_CHARS = 160
+
+# Goal templates (financial.goals) that map onto a session GoalType
+_GOAL_TYPE_MAP = {
+    "child_education": GoalType.CHILD_EDUCATION,
+    "daughter_wedding": GoalType.WEDDING,
+    "home_downpayment": GoalType.HOME_DOWNPAYMENT,
+    "retirement": GoalType.RETIREMENT,
+}
+
+# Keyword groups scanned in user messages (plain substring semantics)
+_FD_KEYWORDS = frozenset({"fd", "fixed deposit"})
+_SIP_RD_KEYWORDS = frozenset({"sip", "rd"})
+_BANK_COMPARE_KEYWORDS = frozenset({"bank", "fd rate", "best rate"})
+_SCHEME_CODES = ("ppf", "ssy", "nps", "pmjjby", "pmsby", "scss")
+
+# Data hub query types, checked in priority order
+_QUERY_TYPE_KEYWORDS = (
+    ("fd", frozenset({"fd", "fixed deposit", "bank rate"})),
+    ("investment", frozenset({"invest", "sip", "mutual fund", "stock"})),
+    ("compare", frozenset({"compare", "vs", "better", "difference"})),
+    ("goal", frozenset({"goal", "retire", "education", "wedding", "ghar"})),
+    ("tax", frozenset({"tax", "80c", "deduction"})),
+)
+
+_ALL_KEYWORDS = frozenset().union(
+    _FD_KEYWORDS, _SIP_RD_KEYWORDS, _BANK_COMPARE_KEYWORDS, _SCHEME_CODES,
+    *(words for _, words in _QUERY_TYPE_KEYWORDS)
+)
+
+# Zero-width lookahead at every offset, longest keyword first, so a single
+# pass reports every keyword occurrence. A match at an offset hides shorter
+# keywords starting at that same offset, so each hit expands to the
+# keywords that are its prefixes ("fd rate" -> {"fd rate", "fd"}).
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_ALL_KEYWORDS, key=len, reverse=True))) + "))"
+)
+_KEYWORD_PREFIXES = {
+    kw: frozenset(other for other in _ALL_KEYWORDS if kw.startswith(other))
+    for kw in _ALL_KEYWORDS
+}
+
+
+def _scan_keywords(message_lower: str) -> set[str]:
+    """Return every known keyword occurring as a substring of the message."""
+    found = set()
+    for hit in set(_KEYWORD_RE.findall(message_lower)):
+        found |= _KEYWORD_PREFIXES[hit]
+    return found
+
+
+# === Deterministic context blocks ===
+# These depend only on their arguments and the static data hub / scheme
+# tables, so identical inputs across sessions are served from memory.
+
+@lru_cache(maxsize=64)
+def _fd_rates_context(user_bank: Optional[str]) -> Optional[str]:
+    """FD rates for the user's bank, or the top FD rates if no bank is known."""
+    if user_bank:
+        rate_info = data_hub.get_bank_fd_rate(user_bank)
+        if not rate_info:
+            return None
+        return (
+            f"\n**{rate_info['bank']} FD Rates:**\n"
+            f"- 1 Year: {rate_info['general_rate']}% (Senior: {rate_info['senior_rate']}%)\n"
+            f"Source: {rate_info['source']}"
+        )
+    
+    # Show best FD rates
+    best_rates = data_hub.get_best_fd_rates(12, False, 5)
+    if not best_rates:
+        return None
+    rates_text = "\n**Top FD Rates (1 Year):**\n"
+    for r in best_rates[:5]:
+        rates_text += f"- {r['bank']}: {r['rate']}%\n"
+    return rates_text
+
+
+@lru_cache(maxsize=1)
+def _bank_comparison_context() -> str:
+    """1-year FD comparison across the top 5 banks."""
+    comparison = data_hub.get_all_bank_rates(12)
+    return data_hub.format_bank_comparison_hinglish({
+        "tenure_months": 12,
+        "comparison": comparison[:5],
+        "best_bank": comparison[0] if comparison else None
+    })
+
+
+@lru_cache(maxsize=16)
+def _scheme_context(scheme_code: str) -> str:
+    """Scheme explanation plus its current rate from the data hub."""
+    explanation = get_scheme_explanation_hinglish(scheme_code)
+    scheme_rate = data_hub.get_scheme_rate(scheme_code)
+    if scheme_rate:
+        return (
+            f"Scheme information: {explanation}\n"
+            f"**Current Rate:** {scheme_rate['rate']}% p.a. (as of {scheme_rate['updated']})"
+        )
+    return f"Scheme information: {explanation}"
+
+
+@lru_cache(maxsize=1)
+def _rd_info_context() -> str:
+    """RD explainer with current RD rates of the big banks."""
+    rd_rates = []
+    for bank in ["hdfc", "sbi", "icici"]:
+        info = data_hub.get_bank_info(bank)
+        if info:
+            rd_rates.append(f"{info.name}: {info.rd_rate}%")
+    return _RD_INFO_CTX_TEMPLATE.format(rates=", ".join(rd_rates))
+
+
+@dataclass(slots=True)
 class ConversationResponse:
     """Response from the conversation orchestrator."""
     text: str
@@ -66,7 +232,7 @@ class ConversationResponse:
             "handoff_requested": self.safety_check.should_handoff,
             "calculation_data": self.calculation_data,
             "should_speak": self.should_speak,
-            "metadata": self.metadata or {}
+            "metadata": self.metadata if self.metadata is not None else {}
         }
 
 
@@ -77,7 +243,23 @@ class ConversationOrchestrator:
     """
     
     def __init__(self):
-        pass
+        self._response_cache = ResponseCache(
+            similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY,
+            ttl_minutes=settings.RESPONSE_CACHE_TTL_MINUTES
+        )
+        # Intent-specific context builders, dispatched from _build_context
+        self._context_handlers = {
+            IntentType.COMPARE_OPTIONS: self._ctx_compare,
+            IntentType.CALCULATE: self._ctx_calculate,
+            IntentType.GOAL_PLANNING: self._ctx_goal,
+            IntentType.GOAL_EDUCATION: self._ctx_goal,
+            IntentType.GOAL_WEDDING: self._ctx_goal,
+            IntentType.GOAL_HOME: self._ctx_goal,
+            IntentType.GOAL_RETIREMENT: self._ctx_goal,
+            IntentType.SCHEME_INFO: self._ctx_scheme,
+            IntentType.SIP_INFO: self._ctx_sip,
+            IntentType.RD_INFO: self._ctx_rd,
+        }
     
     async def process_message(
         self,
@@ -88,50 +270,79 @@ class ConversationOrchestrator:
         Process a user message and generate response.
         
         Flow:
-        1. Safety check
+        1. Safety check (triggers return before intent detection)
         2. Intent detection
-        3. Context building (calculations if needed)
-        4. LLM response generation
-        5. Disclaimer injection
-        6. Update session state
+        3. Response cache lookup (repeated questions skip 5-6)
+        4. Context building (calculations if needed)
+        5. LLM response generation
+        6. Disclaimer injection
+        7. Update session state
         """
         # Step 1: Safety check
         safety_result = check_safety(user_message)
         
-        # Step 2: Intent detection
-        intent_result = detect_intent(user_message)
-        
-        # Step 3: Handle safety triggers
+        # Step 2: Handle safety triggers (no intent detection needed)
         if not safety_result.is_safe:
             response = await self._handle_safety_trigger(
                 safety_result, session, user_message
             )
             return response
         
-        # Step 4: Build context and get calculations if needed
+        # Step 3: Intent detection
+        intent_result = detect_intent(user_message)
+        
+        # Step 4: Look up a near-duplicate question in the response cache
+        # (keyed on the phase this turn lands in)
+        cache_key = None
+        cached = None
+        if settings.RESPONSE_CACHE_ENABLED:
+            new_phase, _ = self._plan_session_update(intent_result)
+            cache_key = ResponseCache.make_key(
+                intent_result.primary_intent.value,
+                intent_result.entities,
+                (new_phase or session.current_phase).value
+            )
+            cached = self._response_cache.lookup(session.session_id, user_message, cache_key)
+        
+        # Step 5: Build context and get calculations if needed
+        # (also on a cache hit: it records profile facts, goals and banks
+        # mentioned in this message)
         context, calculation_data = await self._build_context(
             intent_result, user_message, session
         )
         
-        # Step 5: Get LLM response
-        llm_response = await llm_service.chat(
-            user_message, session, context
-        )
+        # A cache hit only skips the LLM call
+        if cached:
+            return await self._respond_from_cache(
+                cached, user_message, session, intent_result, safety_result
+            )
         
-        # Step 6: Inject disclaimers if needed
-        has_projection = detect_projection_in_response(llm_response)
-        has_calculation = detect_calculation_in_response(llm_response)
+        # Step 6: Get LLM response
+        await llm_service.prefetch_memory_context(session.session_id)
+        llm_response = await llm_service.chat(user_message, session, context)
         
-        if has_projection or has_calculation:
+        turn_number = session.turn_count + 1
+        new_phase, tracked_intent = self._plan_session_update(intent_result)
+        
+        # Step 7: Inject disclaimers if needed
+        has_projection, has_calculation = detect_flags_in_response(llm_response)
+        
+        disclaimer_added = has_projection or has_calculation
+        if disclaimer_added:
             llm_response = inject_disclaimer(llm_response, has_projection, has_calculation)
             session.disclaimers_shown += 1
         
-        # Step 7: Clean response (remove re-introductions after turn 1)
-        turn_number = len(session.conversation_history) // 2 + 1
+        if cache_key is not None:
+            self._response_cache.store(
+                session.session_id, user_message, cache_key,
+                llm_response, calculation_data, disclaimer_added
+            )
+        
+        # Step 8: Clean response (remove re-introductions after turn 1)
         llm_response = clean_response(llm_response, turn_number=turn_number)
         
-        # Step 8: Update session state
-        self._update_session(session, user_message, llm_response, intent_result)
+        # Step 9: Update session state
+        self._update_session(session, user_message, llm_response, new_phase, tracked_intent)
         
         return ConversationResponse(
             text=llm_response,
@@ -144,6 +355,118 @@ class ConversationOrchestrator:
             }
         )
     
+    async def process_message_stream(
+        self,
+        user_message: str,
+        session: SessionState
+    ) -> AsyncGenerator[Union[str, ConversationResponse], None]:
+        """
+        Streaming variant of process_message.
+        
+        Runs the same safety, intent and context steps, then forwards LLM
+        chunks as they arrive. The first _STREAM_HOLDBACK_CHARS are held back
+        and cleaned of re-introductions; projection/calculation flags are
+        checked on the text actually sent and the disclaimer follows as a
+        final chunk. The last item yielded is the ConversationResponse for
+        the turn, carrying the intent and the text stored in the session.
+        """
+        safety_result = check_safety(user_message)
+        if not safety_result.is_safe:
+            response = await self._handle_safety_trigger(
+                safety_result, session, user_message
+            )
+            yield response.text
+            yield response
+            return
+        
+        intent_result = detect_intent(user_message)
+        context, calculation_data = await self._build_context(intent_result, user_message, session)
+        await llm_service.prefetch_memory_context(session.session_id)
+        
+        turn_number = session.turn_count + 1
+        new_phase, tracked_intent = self._plan_session_update(intent_result)
+        
+        sent_parts: list[str] = []
+        head = ""
+        head_sent = False
+        async for chunk in llm_service.chat_stream(user_message, session, context):
+            if head_sent:
+                sent_parts.append(chunk)
+                yield chunk
+                continue
+            head += chunk
+            if len(head) >= _STREAM_HOLDBACK_CHARS:
+                head = clean_stream_head(head, turn_number)
+                head_sent = True
+                sent_parts.append(head)
+                yield head
+        
+        if not head_sent and head:
+            head = clean_stream_head(head, turn_number)
+            sent_parts.append(head)
+            yield head
+        
+        sent_text = "".join(sent_parts)
+        has_projection, has_calculation = detect_flags_in_response(sent_text)
+        if has_projection or has_calculation:
+            with_disclaimer = inject_disclaimer(sent_text, has_projection, has_calculation)
+            disclaimer = with_disclaimer[len(sent_text):]
+            if disclaimer:
+                session.disclaimers_shown += 1
+                sent_text = with_disclaimer
+                yield disclaimer
+        
+        # Same cleanup as the non-streaming path for what goes into the session
+        response_text = clean_response(sent_text, turn_number=turn_number)
+        self._update_session(
+            session, user_message, response_text, new_phase, tracked_intent
+        )
+        
+        yield ConversationResponse(
+            text=response_text,
+            intent=intent_result,
+            safety_check=safety_result,
+            calculation_data=calculation_data,
+            metadata={
+                "phase": session.current_phase.value,
+                "has_goal": session.current_goal is not None
+            }
+        )
+    
+    async def _respond_from_cache(
+        self,
+        cached: CachedResponse,
+        user_message: str,
+        session: SessionState,
+        intent_result: IntentResult,
+        safety_result: SafetyCheckResult
+    ) -> ConversationResponse:
+        """Build a response from a cached LLM reply."""
+        turn_number = session.turn_count + 1
+        new_phase, tracked_intent = self._plan_session_update(intent_result)
+        
+        if cached.disclaimer_added:
+            session.disclaimers_shown += 1
+        
+        # Cleaning depends on the turn, so it is redone for every hit
+        response_text = clean_response(cached.text, turn_number=turn_number)
+        self._update_session(session, user_message, response_text, new_phase, tracked_intent)
+        
+        # chat() is skipped, so queue the turn for MCP memory here
+        await llm_service.process_memory(session.session_id, user_message, response_text)
+        
+        return ConversationResponse(
+            text=response_text,
+            intent=intent_result,
+            safety_check=safety_result,
+            calculation_data=cached.calculation_data,
+            metadata={
+                "phase": session.current_phase.value,
+                "has_goal": session.current_goal is not None,
+                "cached": True
+            }
+        )
+    
     async def _handle_safety_trigger(
         self,
         safety_result: SafetyCheckResult,
@@ -161,12 +484,8 @@ class ConversationOrchestrator:
         # For advisory boundary, we can still be helpful
         if safety_result.trigger_type == SafetyTriggerType.ADVISORY_BOUNDARY:
             # Let LLM provide educational context while maintaining boundary
-            context = (
-                "User is asking for specific recommendations which you cannot provide. "
-                "Politely decline specific recommendations but offer to educate about "
-                "how to evaluate options themselves. Maintain warm, helpful tone."
-            )
-            response_text = await llm_service.chat(user_message, session, context)
+            await llm_service.prefetch_memory_context(session.session_id)
+            response_text = await llm_service.chat(user_message, session, _ADVISORY_BOUNDARY_CTX)
             session.mark_advisory_boundary()
         
         # For hard handoff triggers, use template response
@@ -178,12 +497,11 @@ class ConversationOrchestrator:
             primary_intent=IntentType.UNCLEAR,
             confidence=0.0,
             entities={},
-            secondary_intents=[]
+            secondary_intents=()
         )
         
         # Update session
-        session.add_message("user", user_message)
-        session.add_message("assistant", response_text)
+        session.add_messages([("user", user_message), ("assistant", response_text)])
         
         return ConversationResponse(
             text=response_text,
@@ -200,16 +518,19 @@ class ConversationOrchestrator:
     ) -> tuple[Optional[str], Optional[dict]]:
         """Build rich context for LLM based on intent, data hub, and knowledge base."""
         
-        context_parts = []
+        context_parts: list[str] = []
         calculation_data = None
         
+        # Lowercased once and shared by every extractor / detector below
+        msg_lower = user_message.lower()
+        
         # === GOAL INTERVIEW INTEGRATION ===
         # Extract info from user message and update profile
         interview_state = goal_interview.get_or_create_state(session.session_id)
-        extracted = goal_interview.extract_info_from_message(user_message, interview_state)
+        extracted = goal_interview.extract_info_from_message(user_message, interview_state, msg_lower)
         
         # Detect goal from message
-        detected_goal_cat = goal_interview.detect_goal_from_message(user_message)
+        detected_goal_cat = goal_interview.detect_goal_from_message(user_message, msg_lower)
         if detected_goal_cat:
             goal_interview.set_goal(session.session_id, detected_goal_cat)
         
@@ -227,146 +548,28 @@ class ConversationOrchestrator:
         # Detect if user mentioned a bank
         user_bank = interview_state.profile.primary_bank
         if not user_bank:
-            bank_code = data_hub.resolve_bank_name(user_message)
+            bank_code = data_hub.resolve_bank_name(user_message, msg_lower)
             if bank_code:
                 user_bank = bank_code
                 interview_state.profile.primary_bank = bank_code
         
         # Add relevant financial data based on intent/query
-        query_type = self._detect_query_type(user_message, intent)
+        keywords = _scan_keywords(msg_lower)
+        query_type = self._detect_query_type(keywords, intent)
         data_context = data_hub.get_context_for_llm(user_bank, query_type)
         if data_context:
             context_parts.append(data_context)
         
         # === SPECIFIC FD/BANK RATE QUERIES ===
-        if "fd" in user_message.lower() or "fixed deposit" in user_message.lower():
-            if user_bank:
-                rate_info = data_hub.get_bank_fd_rate(user_bank)
-                if rate_info:
-                    context_parts.append(
-                        f"\n**{rate_info['bank']} FD Rates:**\n"
-                        f"- 1 Year: {rate_info['general_rate']}% (Senior: {rate_info['senior_rate']}%)\n"
-                        f"Source: {rate_info['source']}"
-                    )
-            else:
-                # Show best FD rates
-                best_rates = data_hub.get_best_fd_rates(12, False, 5)
-                if best_rates:
-                    rates_text = "\n**Top FD Rates (1 Year):**\n"
-                    for r in best_rates[:5]:
-                        rates_text += f"- {r['bank']}: {r['rate']}%\n"
-                    context_parts.append(rates_text)
-        
-        # === COMPARISON REQUESTS ===
-        if intent.primary_intent == IntentType.COMPARE_OPTIONS:
-            if "sip" in user_message.lower() and "rd" in user_message.lower():
-                amount = intent.entities.get("amount", 5000)
-                years = intent.entities.get("duration_years", 10)
-                comparison = compare_sip_vs_rd(amount, years)
-                context_parts.append(f"Calculation context: {comparison['summary_hinglish']}")
-                calculation_data = comparison
-            
-            # Bank comparison
-            elif any(word in user_message.lower() for word in ["bank", "fd rate", "best rate"]):
-                comparison = data_hub.get_all_bank_rates(12)
-                context_parts.append(data_hub.format_bank_comparison_hinglish({
-                    "tenure_months": 12,
-                    "comparison": comparison[:5],
-                    "best_bank": comparison[0] if comparison else None
-                }))
-        
-        # === CALCULATION REQUESTS ===
-        elif intent.primary_intent == IntentType.CALCULATE:
-            amount = intent.entities.get("amount")
-            years = intent.entities.get("duration_years")
-            
-            if amount and years:
-                sip_result = calculate_sip(amount, years)
-                rd_result = calculate_rd(amount, years)
-                context_parts.append(
-                    f"SIP Calculation: {sip_result.format_summary_hinglish()}\n"
-                    f"For comparison - RD would give: Rs {rd_result.maturity_value:,.0f}"
-                )
-                calculation_data = sip_result.to_dict()
-        
-        # === GOAL PLANNING ===
-        elif intent.primary_intent in [
-            IntentType.GOAL_PLANNING, 
-            IntentType.GOAL_EDUCATION,
-            IntentType.GOAL_WEDDING,
-            IntentType.GOAL_HOME,
-            IntentType.GOAL_RETIREMENT
-        ]:
-            detected_goal = detect_goal_from_text(user_message)
-            if detected_goal:
-                template = get_goal_template(detected_goal)
-                if template:
-                    # Get next interview question for this goal
-                    next_q = goal_interview.get_next_question(session.session_id)
-                    
-                    context_parts.append(
-                        f"User is planning for: {template.name_hinglish}. "
-                        f"Typical timeline: {template.typical_timeline_years} years. "
-                        f"Typical cost: Rs {template.typical_cost_range[0]}-{template.typical_cost_range[1]} lakhs. "
-                    )
-                    
-                    if next_q:
-                        context_parts.append(f"**Ask this question naturally:** {next_q[1]}")
-                        goal_interview.mark_question_asked(session.session_id, next_q[0])
-                    
-                    # Update session goal
-                    goal_type_map = {
-                        "child_education": GoalType.CHILD_EDUCATION,
-                        "daughter_wedding": GoalType.WEDDING,
-                        "home_downpayment": GoalType.HOME_DOWNPAYMENT,
-                        "retirement": GoalType.RETIREMENT,
-                    }
-                    if detected_goal in goal_type_map:
-                        session.set_goal(goal_type_map[detected_goal])
-        
-        # === SCHEME INFO ===
-        elif intent.primary_intent == IntentType.SCHEME_INFO:
-            for scheme_code in ["ppf", "ssy", "nps", "pmjjby", "pmsby", "scss"]:
-                if scheme_code in user_message.lower():
-                    explanation = get_scheme_explanation_hinglish(scheme_code)
-                    # Add current rate from data hub
-                    scheme_rate = data_hub.get_scheme_rate(scheme_code)
-                    if scheme_rate:
-                        context_parts.append(
-                            f"Scheme information: {explanation}\n"
-                            f"**Current Rate:** {scheme_rate['rate']}% p.a. (as of {scheme_rate['updated']})"
-                        )
-                    else:
-                        context_parts.append(f"Scheme information: {explanation}")
-                    break
-        
-        # === SIP INFO ===
-        elif intent.primary_intent == IntentType.SIP_INFO:
-            context_parts.append(
-                "User wants to know about SIP. Key points: "
-                "SIP = Systematic Investment Plan in mutual funds. "
-                "Can start with Rs 500/month. Rupee cost averaging benefit. "
-                "Market-linked returns (historical avg ~10-12%). "
-                "Good for long-term goals (5+ years)."
-            )
+        if keywords & _FD_KEYWORDS:
+            fd_context = _fd_rates_context(user_bank)
+            if fd_context:
+                context_parts.append(fd_context)
         
-        # === RD INFO ===
-        elif intent.primary_intent == IntentType.RD_INFO:
-            # Get actual RD rates from data hub
-            best_rd_banks = ["hdfc", "sbi", "icici"]
-            rd_rates = []
-            for bank in best_rd_banks:
-                info = data_hub.get_bank_info(bank)
-                if info:
-                    rd_rates.append(f"{info.name}: {info.rd_rate}%")
-            
-            context_parts.append(
-                f"User wants to know about RD. Key points: "
-                f"RD = Recurring Deposit in bank. "
-                f"Current RD rates: {', '.join(rd_rates)}. "
-                f"Government guarantee up to Rs 5 lakhs (DICGC). "
-                f"Good for short-term goals or risk-averse users."
-            )
+        # === INTENT-SPECIFIC CONTEXT ===
+        handler = self._context_handlers.get(intent.primary_intent)
+        if handler:
+            calculation_data = handler(intent, user_message, msg_lower, keywords, session, context_parts)
         
         # === PROACTIVE QUESTION INJECTION ===
         # If profile is incomplete and we should ask a question
@@ -377,55 +580,145 @@ class ConversationOrchestrator:
                     f"\n**Suggestion:** Naturally ask about {next_q[0]} to give better advice: '{next_q[1]}'"
                 )
         
-        context = "\n\n".join(context_parts) if context_parts else None
-        return context, calculation_data
+        # Skip the join for the common empty / single-part cases
+        if not context_parts:
+            return None, calculation_data
+        if len(context_parts) == 1:
+            return context_parts[0], calculation_data
+        return "\n\n".join(context_parts), calculation_data
     
-    def _detect_query_type(self, message: str, intent: IntentResult) -> Optional[str]:
+    # --- Intent context handlers ---
+    # Each appends to context_parts and returns calculation data, if any.
+    
+    def _ctx_compare(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """Comparison requests: SIP vs RD numbers, or bank FD rates."""
+        if _SIP_RD_KEYWORDS <= keywords:
+            amount = intent.entities.get("amount", 5000)
+            years = intent.entities.get("duration_years", 10)
+            comparison = compare_sip_vs_rd(amount, years)
+            context_parts.append(f"Calculation context: {comparison['summary_hinglish']}")
+            return comparison
+        
+        # Bank comparison
+        if keywords & _BANK_COMPARE_KEYWORDS:
+            context_parts.append(_bank_comparison_context())
+        return None
+    
+    def _ctx_calculate(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """Calculation requests: SIP projection with RD for comparison."""
+        amount = intent.entities.get("amount")
+        years = intent.entities.get("duration_years")
+        
+        if amount and years:
+            sip_result = calculate_sip(amount, years)
+            rd_result = calculate_rd(amount, years)
+            context_parts.append(
+                f"SIP Calculation: {sip_result.format_summary_hinglish()}\n"
+                f"For comparison - RD would give: Rs {rd_result.maturity_value:,.0f}"
+            )
+            return sip_result.to_dict()
+        return None
+    
+    def _ctx_goal(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """Goal planning: goal template plus the next interview question."""
+        detected_goal = detect_goal_from_text(user_message, msg_lower)
+        if detected_goal:
+            template = get_goal_template(detected_goal)
+            if template:
+                # Get next interview question for this goal
+                next_q = goal_interview.get_next_question(session.session_id)
+                
+                context_parts.append(
+                    f"User is planning for: {template.name_hinglish}. "
+                    f"Typical timeline: {template.typical_timeline_years} years. "
+                    f"Typical cost: Rs {template.typical_cost_range[0]}-{template.typical_cost_range[1]} lakhs. "
+                )
+                
+                if next_q:
+                    context_parts.append(f"**Ask this question naturally:** {next_q[1]}")
+                    goal_interview.mark_question_asked(session.session_id, next_q[0])
+                
+                # Update session goal
+                goal_type = _GOAL_TYPE_MAP.get(detected_goal)
+                if goal_type:
+                    session.set_goal(goal_type)
+        return None
+    
+    def _ctx_scheme(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """Scheme info for the first scheme named in the message."""
+        for scheme_code in _SCHEME_CODES:
+            if scheme_code in keywords:
+                context_parts.append(_scheme_context(scheme_code))
+                break
+        return None
+    
+    def _ctx_sip(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """SIP explainer."""
+        context_parts.append(_SIP_INFO_CTX)
+        return None
+    
+    def _ctx_rd(
+        self, intent: IntentResult, user_message: str, msg_lower: str,
+        keywords: set[str], session: SessionState, context_parts: list[str]
+    ) -> Optional[dict]:
+        """RD explainer with current bank RD rates."""
+        context_parts.append(_rd_info_context())
+        return None
+    
+    def _detect_query_type(self, keywords: set[str], intent: IntentResult) -> Optional[str]:
         """Detect the type of financial query for data hub context."""
-        message_lower = message.lower()
-        
-        if any(w in message_lower for w in ["fd", "fixed deposit", "bank rate"]):
-            return "fd"
-        elif any(w in message_lower for w in ["invest", "sip", "mutual fund", "stock"]):
-            return "investment"
-        elif any(w in message_lower for w in ["compare", "vs", "better", "difference"]):
-            return "compare"
-        elif any(w in message_lower for w in ["goal", "retire", "education", "wedding", "ghar"]):
-            return "goal"
-        elif any(w in message_lower for w in ["tax", "80c", "deduction"]):
-            return "tax"
+        for query_type, words in _QUERY_TYPE_KEYWORDS:
+            if keywords & words:
+                return query_type
         
         return None
     
+    def _plan_session_update(
+        self,
+        intent: IntentResult
+    ) -> tuple[Optional[ConversationPhase], Optional[str]]:
+        """Work out the phase change and intent to track for this turn."""
+        new_phase = _PHASE_BY_INTENT.get(intent.primary_intent)
+        tracked_intent = (
+            None if intent.primary_intent in _UNTRACKED_INTENTS
+            else intent.primary_intent.value
+        )
+        return new_phase, tracked_intent
+    
     def _update_session(
         self,
         session: SessionState,
         user_message: str,
         response: str,
-        intent: IntentResult
+        new_phase: Optional[ConversationPhase],
+        tracked_intent: Optional[str]
     ):
         """Update session state after processing."""
         # Add messages to history
-        session.add_message("user", user_message)
-        session.add_message("assistant", response)
+        session.add_messages([("user", user_message), ("assistant", response)])
         
         # Track detected intents
-        if intent.primary_intent not in [IntentType.UNCLEAR, IntentType.CHITCHAT]:
-            if intent.primary_intent.value not in session.detected_intents:
-                session.detected_intents.append(intent.primary_intent.value)
+        if tracked_intent:
+            session.add_detected_intent(tracked_intent)
         
         # Update phase based on intent
-        if intent.primary_intent == IntentType.GREETING:
-            session.current_phase = ConversationPhase.GREETING
-        elif intent.primary_intent in [
-            IntentType.GOAL_PLANNING, IntentType.GOAL_EDUCATION,
-            IntentType.GOAL_WEDDING, IntentType.GOAL_HOME, IntentType.GOAL_RETIREMENT
-        ]:
-            session.current_phase = ConversationPhase.GOAL_DISCOVERY
-        elif intent.primary_intent in [IntentType.EXPLAIN_CONCEPT, IntentType.SCHEME_INFO]:
-            session.current_phase = ConversationPhase.EDUCATING
-        elif intent.primary_intent == IntentType.CALCULATE:
-            session.current_phase = ConversationPhase.CALCULATING
+        if new_phase is not None:
+            session.current_phase = new_phase
         
         # Try to extract user name if mentioned
         self._extract_user_name(user_message, session)
@@ -435,18 +728,11 @@ class ConversationOrchestrator:
         if session.user_name:
             return
         
-        # Common patterns: "mera naam X hai", "I am X", "main X hoon"
-        import re
-        patterns = [
-            r"(?:mera\s+naam|my\s+name\s+is|i\s+am|main)\s+([A-Za-z]+)",
-            r"([A-Za-z]+)\s+(?:bol\s+raha|speaking)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NAME_RES:
+            match = pattern.search(text)
             if match:
                 name = match.group(1).strip().title()
-                if len(name) > 2 and name.lower() not in ["hai", "hoon", "hun", "the"]:
+                if len(name) > 2 and name.lower() not in _NAME_STOPWORDS:
                     session.user_name = name
                     break
 
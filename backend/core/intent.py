@@ -5,6 +5,7 @@ Identifies user intents from Hinglish text for routing and context.
 
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 
@@ -44,13 +45,13 @@ class IntentType(str, Enum):
     CHITCHAT = "chitchat"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntentResult:
-    """Result of intent detection."""
+    """Result of intent detection (immutable; detect_intent shares cached results)."""
     primary_intent: IntentType
     confidence: float  # 0.0 to 1.0
     entities: dict     # Extracted entities like amounts, years
-    secondary_intents: list[IntentType]
+    secondary_intents: tuple[IntentType, ...]
 
 
 # Intent patterns (Hinglish + English)
@@ -179,33 +180,76 @@ ENTITY_PATTERNS = {
     ],
 }
 
+# Compiled once at import; all patterns are matched against lowercased text
+_COMPILED_INTENT_PATTERNS = {
+    intent_type: tuple(re.compile(pattern) for pattern in patterns)
+    for intent_type, patterns in INTENT_PATTERNS.items()
+}
+# One alternation per intent: a single search rules out an intent when none
+# of its patterns match, which is the common case for most intents
+_INTENT_GATES = {
+    intent_type: re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    for intent_type, patterns in INTENT_PATTERNS.items()
+}
+_DIGIT_RE = re.compile(r"\d")
+_COMPILED_ENTITY_PATTERNS = {
+    entity: tuple(re.compile(pattern) for pattern in patterns)
+    for entity, patterns in ENTITY_PATTERNS.items()
+}
+
+# Amount unit words -> multiplier to rupees
+_AMOUNT_UNIT_MULTIPLIERS = {
+    "lakh": 100000, "lac": 100000, "lakhs": 100000,
+    "crore": 10000000, "crores": 10000000,
+    "k": 1000, "thousand": 1000,
+}
+
 
 def detect_intent(text: str) -> IntentResult:
     """
     Detect user intent from text.
     
+    Classification is cached per exact text (users repeat short questions
+    a lot); every call gets its own entities dict.
+    
     Args:
         text: User's input text (Hinglish supported)
     
     Returns:
         IntentResult with primary intent, confidence, and entities
     """
+    cached = _classify_intent(text)
+    return IntentResult(
+        primary_intent=cached.primary_intent,
+        confidence=cached.confidence,
+        entities=dict(cached.entities),
+        secondary_intents=cached.secondary_intents
+    )
+
+
+@lru_cache(maxsize=2048)
+def _classify_intent(text: str) -> IntentResult:
+    """Cached body of detect_intent; its result is shared, never hand it out."""
     text_lower = text.lower().strip()
     
-    # Track matches
+    # Track matches (and the first intent with the most matches)
     matches: dict[IntentType, int] = {}
+    best_intent, max_matches = None, 0
     
     # Check each intent pattern
-    for intent_type, patterns in INTENT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                matches[intent_type] = matches.get(intent_type, 0) + 1
+    for intent_type, patterns in _COMPILED_INTENT_PATTERNS.items():
+        if not _INTENT_GATES[intent_type].search(text_lower):
+            continue
+        count = sum(1 for pattern in patterns if pattern.search(text_lower))
+        matches[intent_type] = count
+        if count > max_matches:
+            best_intent, max_matches = intent_type, count
     
     # Extract entities
-    entities = extract_entities(text)
+    entities = extract_entities(text, text_lower)
     
     # Determine primary intent
-    if not matches:
+    if best_intent is None:
         # Check if it's a calculation question based on entities
         if entities.get("amount") or entities.get("duration_years"):
             primary = IntentType.CALCULATE
@@ -214,19 +258,16 @@ def detect_intent(text: str) -> IntentResult:
             primary = IntentType.UNCLEAR
             confidence = 0.3
     else:
-        # Sort by match count
-        sorted_intents = sorted(matches.items(), key=lambda x: x[1], reverse=True)
-        primary = sorted_intents[0][0]
+        primary = best_intent
         
         # Calculate confidence based on match count and specificity
-        max_matches = sorted_intents[0][1]
         confidence = min(0.5 + (max_matches * 0.15), 0.95)
     
     # Get secondary intents
-    secondary = [
-        intent for intent, count in matches.items()
+    secondary = tuple(
+        intent for intent in matches
         if intent != primary
-    ][:3]  # Top 3 secondary
+    )[:3]  # Top 3 secondary
     
     return IntentResult(
         primary_intent=primary,
@@ -236,57 +277,57 @@ def detect_intent(text: str) -> IntentResult:
     )
 
 
-def extract_entities(text: str) -> dict:
+def extract_entities(text: str, text_lower: Optional[str] = None) -> dict:
     """
     Extract entities (amounts, durations, etc.) from text.
+    Pass text_lower if the caller has already lowercased the text.
     """
     entities = {}
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Every entity pattern captures a number; most chat messages have none
+    if not _DIGIT_RE.search(text_lower):
+        return entities
     
     # Extract amounts
-    for pattern in ENTITY_PATTERNS["amount"]:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPILED_ENTITY_PATTERNS["amount"]:
+        match = pattern.search(text_lower)
         if match:
             amount = float(match.group(1).replace(",", ""))
             unit = match.group(2) if len(match.groups()) > 1 else None
             
             # Convert to base amount
             if unit:
-                unit = unit.lower()
-                if unit in ["lakh", "lac", "lakhs"]:
-                    amount *= 100000
-                elif unit in ["crore", "crores"]:
-                    amount *= 10000000
-                elif unit in ["k", "thousand"]:
-                    amount *= 1000
+                amount *= _AMOUNT_UNIT_MULTIPLIERS.get(unit.lower(), 1)
             
             entities["amount"] = amount
             break
     
     # Extract duration in years
-    for pattern in ENTITY_PATTERNS["duration_years"]:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPILED_ENTITY_PATTERNS["duration_years"]:
+        match = pattern.search(text_lower)
         if match:
             entities["duration_years"] = int(match.group(1))
             break
     
     # Extract duration in months
-    for pattern in ENTITY_PATTERNS["duration_months"]:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPILED_ENTITY_PATTERNS["duration_months"]:
+        match = pattern.search(text_lower)
         if match:
             entities["duration_months"] = int(match.group(1))
             break
     
     # Extract percentage
-    for pattern in ENTITY_PATTERNS["percentage"]:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPILED_ENTITY_PATTERNS["percentage"]:
+        match = pattern.search(text_lower)
         if match:
             entities["percentage"] = float(match.group(1))
             break
     
     # Extract age
-    for pattern in ENTITY_PATTERNS["age"]:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPILED_ENTITY_PATTERNS["age"]:
+        match = pattern.search(text_lower)
         if match:
             # Find the numeric group
             for group in match.groups():
@@ -298,28 +339,31 @@ def extract_entities(text: str) -> dict:
     return entities
 
 
+# Human-readable intent descriptions
+_INTENT_DESCRIPTIONS = {
+    IntentType.GREETING: "User is greeting",
+    IntentType.FAREWELL: "User is saying goodbye",
+    IntentType.EXPLAIN_CONCEPT: "User wants explanation of a concept",
+    IntentType.COMPARE_OPTIONS: "User wants to compare options",
+    IntentType.CALCULATE: "User wants a calculation",
+    IntentType.GOAL_PLANNING: "User wants to plan for a financial goal",
+    IntentType.GOAL_EDUCATION: "User wants to plan for education",
+    IntentType.GOAL_WEDDING: "User wants to plan for wedding",
+    IntentType.GOAL_HOME: "User wants to plan for home purchase",
+    IntentType.GOAL_RETIREMENT: "User wants to plan for retirement",
+    IntentType.SCHEME_INFO: "User wants information about govt schemes",
+    IntentType.SIP_INFO: "User wants information about SIP",
+    IntentType.RD_INFO: "User wants information about RD",
+    IntentType.FD_INFO: "User wants information about FD",
+    IntentType.TAX_INFO: "User wants tax-related information",
+    IntentType.START_SIP: "User wants to start a SIP",
+    IntentType.STOP_SIP: "User wants to stop a SIP",
+    IntentType.HELP: "User needs help",
+    IntentType.UNCLEAR: "Intent is unclear",
+    IntentType.CHITCHAT: "General conversation",
+}
+
+
 def get_intent_description(intent: IntentType) -> str:
     """Get human-readable description of an intent."""
-    descriptions = {
-        IntentType.GREETING: "User is greeting",
-        IntentType.FAREWELL: "User is saying goodbye",
-        IntentType.EXPLAIN_CONCEPT: "User wants explanation of a concept",
-        IntentType.COMPARE_OPTIONS: "User wants to compare options",
-        IntentType.CALCULATE: "User wants a calculation",
-        IntentType.GOAL_PLANNING: "User wants to plan for a financial goal",
-        IntentType.GOAL_EDUCATION: "User wants to plan for education",
-        IntentType.GOAL_WEDDING: "User wants to plan for wedding",
-        IntentType.GOAL_HOME: "User wants to plan for home purchase",
-        IntentType.GOAL_RETIREMENT: "User wants to plan for retirement",
-        IntentType.SCHEME_INFO: "User wants information about govt schemes",
-        IntentType.SIP_INFO: "User wants information about SIP",
-        IntentType.RD_INFO: "User wants information about RD",
-        IntentType.FD_INFO: "User wants information about FD",
-        IntentType.TAX_INFO: "User wants tax-related information",
-        IntentType.START_SIP: "User wants to start a SIP",
-        IntentType.STOP_SIP: "User wants to stop a SIP",
-        IntentType.HELP: "User needs help",
-        IntentType.UNCLEAR: "Intent is unclear",
-        IntentType.CHITCHAT: "General conversation",
-    }
-    return descriptions.get(intent, "Unknown intent")
+    return _INTENT_DESCRIPTIONS.get(intent, "Unknown intent")
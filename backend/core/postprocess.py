@@ -45,6 +45,33 @@ INTRO_PATTERNS = [
 # Compiled patterns for performance
 COMPILED_INTRO_PATTERNS = [re.compile(p, re.IGNORECASE) for p in INTRO_PATTERNS]
 
+# The whole intro block in one match: any run of intro phrases and the
+# whitespace/punctuation between them, starting at the beginning of the text
+_INTRO_BLOCK_RE = re.compile(
+    "(?:" + "|".join(f"(?:{p[1:]})" for p in INTRO_PATTERNS) + r"|[\s,.:!;]+)+",
+    re.IGNORECASE
+)
+# Every intro phrase starts with a literal letter, so text starting with
+# anything else (and not whitespace/punctuation) cannot hold an intro
+_INTRO_START_RE = re.compile(
+    "[" + "".join(sorted({p[1] for p in INTRO_PATTERNS})) + r"\s,.:!;]",
+    re.IGNORECASE
+)
+
+# Formatting fixes, applied in a single pass by _clean_formatting
+_FORMAT_RE = re.compile(
+    r"(?P<punct> +(?=[,.!?]))"    # space(s) before punctuation -> removed
+    r"|(?P<spaces> {2,})"         # multiple spaces -> one
+    r"|(?P<newlines>\n{3,})"      # 3+ newlines -> paragraph break
+)
+_FORMAT_REPLACEMENTS = {"punct": "", "spaces": " ", "newlines": "\n\n"}
+
+# Whitespace following sentence-ending punctuation (voice trimming)
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+# ASR markers for unclear audio, matched against the lowercased text
+_UNCLEAR_AUDIO_RE = re.compile(r"\[audio unclear|\[unclear audio|audio unclear|please try again")
+
 
 def clean_response(text: str, turn_number: int = 1, for_voice: bool = False) -> str:
     """
@@ -77,28 +104,28 @@ def clean_response(text: str, turn_number: int = 1, for_voice: bool = False) ->
     return cleaned
 
 
+def clean_stream_head(text: str, turn_number: int = 1) -> str:
+    """
+    Clean the held-back start of a streamed response.
+    Re-introductions only appear at the start, so the rest of the stream
+    can be forwarded as it arrives.
+    """
+    if turn_number > 1:
+        return _strip_introductions(text.lstrip())
+    return text
+
+
 def _strip_introductions(text: str) -> str:
     """Remove greeting/introduction patterns from start of text.
     
-    Loops until no more patterns match, handling multi-part intros like:
+    Strips every leading intro phrase in one match, handling multi-part intros like:
     'Namaste! Main SamairaAI hoon, aapki financial advisor. Real content...'
     """
     result = text
-    max_iterations = 10  # Safety limit
-    
-    for _ in range(max_iterations):
-        previous = result
-        
-        # Apply all patterns (each pattern has ^ anchor, matches at start)
-        for pattern in COMPILED_INTRO_PATTERNS:
-            result = pattern.sub('', result)
-        
-        # Clean up leading whitespace/punctuation after each pass
-        result = re.sub(r'^[\s,.:!;]+', '', result)
-        
-        # If no changes this iteration, we're done
-        if result == previous:
-            break
+    if _INTRO_START_RE.match(text):
+        match = _INTRO_BLOCK_RE.match(text)
+        if match:
+            result = text[match.end():]
     
     # Capitalize first letter if it's now lowercase
     if result and result[0].islower():
@@ -108,16 +135,8 @@ def _strip_introductions(text: str) -> str:
 
 
 def _clean_formatting(text: str) -> str:
-    """Fix common formatting issues."""
-    # Remove multiple spaces
-    text = re.sub(r' {2,}', ' ', text)
-    
-    # Remove multiple newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # Fix space before punctuation
-    text = re.sub(r' ([,.!?])', r'\1', text)
-    
+    """Fix common formatting issues (multiple spaces/newlines, space before punctuation)."""
+    text = _FORMAT_RE.sub(lambda m: _FORMAT_REPLACEMENTS[m.lastgroup], text)
     return text.strip()
 
 
@@ -126,14 +145,18 @@ def _trim_for_voice(text: str, max_sentences: int = 5) -> str:
     Trim response for voice output.
     Keeps first few sentences to avoid overly long TTS.
     """
-    # Split by sentence-ending punctuation
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    # Find the break after the Nth sentence without splitting the whole text
+    end = None
+    for count, match in enumerate(_SENTENCE_BREAK_RE.finditer(text), 1):
+        if count == max_sentences:
+            end = match.start()
+            break
     
-    if len(sentences) <= max_sentences:
+    if end is None:
         return text
     
-    # Keep first N sentences
-    trimmed = ' '.join(sentences[:max_sentences])
+    # Keep first N sentences, joined by single spaces
+    trimmed = _SENTENCE_BREAK_RE.sub(' ', text[:end])
     
     # Ensure it ends properly
     if not trimmed.endswith(('.', '!', '?')):
@@ -144,11 +167,4 @@ def _trim_for_voice(text: str, max_sentences: int = 5) -> str:
 
 def is_unclear_audio_response(text: str) -> bool:
     """Check if the text indicates unclear audio (from ASR)."""
-    unclear_markers = [
-        "[Audio unclear",
-        "[Unclear audio",
-        "Audio unclear",
-        "please try again",
-    ]
-    text_lower = text.lower()
-    return any(marker.lower() in text_lower for marker in unclear_markers)
+    return _UNCLEAR_AUDIO_RE.search(text.lower()) is not None
@@ -0,0 +1,150 @@
+"""
+Semantic response cache for SamairaAI.
+Serves a previous LLM reply when the user repeats (or nearly repeats) a
+question within the same session, skipping the LLM round-trip.
+"""
+
+import math
+import re
+import sys
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9₹%]+")
+
+
+def _vectorize(text: str) -> tuple[Counter, float]:
+    """
+    Bag-of-words vector for a message plus its L2 norm.
+    Tokens are interned so the vocabulary is shared by every stored entry.
+    """
+    counts = Counter(map(sys.intern, _TOKEN_RE.findall(text.lower())))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return counts, norm
+
+
+def _cosine(a: Counter, a_norm: float, b: Counter, b_norm: float) -> float:
+    """Cosine similarity of two bag-of-words vectors."""
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[token] for token, count in a.items() if token in b)
+    return dot / (a_norm * b_norm)
+
+
+@dataclass
+class CachedResponse:
+    """An LLM reply stored for reuse."""
+    text: str                       # Response after disclaimer injection, before cleaning
+    calculation_data: Optional[dict]
+    disclaimer_added: bool
+    key: tuple                      # (intent, entities, phase) the reply was generated for
+    vector: Counter
+    norm: float
+    created_at: float
+
+
+class ResponseCache:
+    """
+    Per-session near-duplicate cache for LLM responses.
+
+    A hit requires the same intent, the same extracted entities and the
+    same conversation phase, plus a message similarity >= threshold.
+    Entities are part of the key so "5000 for 10 years" never reuses the
+    answer for "6000 for 10 years".
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.9,
+        ttl_minutes: int = 24 * 60,
+        max_entries_per_session: int = 20,
+        max_sessions: int = 1000
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_minutes * 60
+        self.max_entries_per_session = max_entries_per_session
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, list[CachedResponse]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(intent: str, entities: dict, phase: str) -> tuple:
+        """Build the exact-match part of a cache key."""
+        return (intent, tuple(sorted(entities.items())), phase)
+
+    def lookup(self, session_id: str, message: str, key: tuple) -> Optional[CachedResponse]:
+        """Return the most similar cached reply for this session, if close enough."""
+        entries = self._sessions.get(session_id)
+        if not entries:
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        entries[:] = [e for e in entries if now - e.created_at <= self.ttl_seconds]
+
+        vector, norm = _vectorize(message)
+        best, best_score = None, self.similarity_threshold
+        for entry in entries:
+            if entry.key != key:
+                continue
+            score = _cosine(vector, norm, entry.vector, entry.norm)
+            if score >= best_score:
+                best, best_score = entry, score
+
+        if best is None:
+            self.misses += 1
+            return None
+
+        self._sessions.move_to_end(session_id)
+        self.hits += 1
+        return best
+
+    def store(
+        self,
+        session_id: str,
+        message: str,
+        key: tuple,
+        text: str,
+        calculation_data: Optional[dict] = None,
+        disclaimer_added: bool = False
+    ):
+        """Remember an LLM reply for later near-duplicate messages."""
+        vector, norm = _vectorize(message)
+        if not norm:
+            return
+
+        entries = self._sessions.setdefault(session_id, [])
+        self._sessions.move_to_end(session_id)
+        entries.append(CachedResponse(
+            text=text,
+            calculation_data=calculation_data,
+            disclaimer_added=disclaimer_added,
+            key=key,
+            vector=vector,
+            norm=norm,
+            created_at=time.monotonic()
+        ))
+        if len(entries) > self.max_entries_per_session:
+            del entries[0]
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def clear_session(self, session_id: str):
+        """Drop all cached replies for a session."""
+        self._sessions.pop(session_id, None)
+
+    def get_stats(self) -> dict:
+        """Cache statistics for monitoring."""
+        return {
+            "sessions": len(self._sessions),
+            "entries": sum(len(e) for e in self._sessions.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -6,6 +6,7 @@ Detects advisory boundaries, triggers handoffs, and injects disclaimers.
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -21,9 +22,9 @@ class SafetyTriggerType(str, Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyCheckResult:
-    """Result of a safety check on user input."""
+    """Result of a safety check on user input (immutable; results are shared)."""
     is_safe: bool
     trigger_type: SafetyTriggerType
     matched_pattern: Optional[str] = None
@@ -99,6 +100,40 @@ HIGH_VALUE_PATTERNS = [
 ]
 
 
+# Patterns with no regex syntax at all can be tested with a plain substring check
+_LITERAL_PATTERN_RE = re.compile(r"[a-z0-9 ]+")
+
+
+def _compile_category(patterns: list[str]) -> tuple[re.Pattern, tuple[tuple[str, Optional[re.Pattern]], ...]]:
+    """
+    Compile a trigger category into (gate, patterns). The gate is one
+    alternation of every pattern, so a category that does not apply is
+    ruled out with a single search. Each pattern is kept as
+    (source, compiled regex), with None for plain literals.
+    """
+    gate = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    return gate, tuple(
+        (pattern, None if _LITERAL_PATTERN_RE.fullmatch(pattern) else re.compile(pattern))
+        for pattern in patterns
+    )
+
+
+_COMPLAINT_RES = _compile_category(COMPLAINT_PATTERNS)
+_HANDOFF_RES = _compile_category(HANDOFF_PATTERNS)
+_LEGAL_RES = _compile_category(LEGAL_PATTERNS)
+_HIGH_VALUE_RES = _compile_category(HIGH_VALUE_PATTERNS)
+_TAX_RES = _compile_category(TAX_PATTERNS)
+_ADVISORY_RES = _compile_category(ADVISORY_PATTERNS)
+
+# Every trigger pattern in one alternation: messages that match none of
+# them (the vast majority) skip the per-category checks entirely
+_ANY_TRIGGER_RE = re.compile("|".join(
+    gate.pattern for gate, _ in (
+        _COMPLAINT_RES, _HANDOFF_RES, _LEGAL_RES, _HIGH_VALUE_RES, _TAX_RES, _ADVISORY_RES
+    )
+))
+
+
 # Handoff response templates
 HANDOFF_RESPONSES = {
     SafetyTriggerType.ADVISORY_BOUNDARY: (
@@ -147,27 +182,58 @@ CALCULATION_DISCLAIMER = (
     "Actual returns vary ho sakte hain.*"
 )
 
+# Short pleasantries that can never trip a safety pattern.
+# Messages made up only of these skip the regex scan entirely.
+TRIVIAL_SAFE_WORDS = frozenset({
+    "hi", "hello", "hey", "namaste", "namaskar", "ji", "haan", "ok", "okay",
+    "thanks", "thank", "you", "dhanyawad", "shukriya", "bye", "theek", "hai",
+})
 
-def _check_patterns(text: str, patterns: list[str]) -> Optional[str]:
-    """Check text against a list of regex patterns. Returns matched pattern or None."""
-    text_lower = text.lower()
-    for pattern in patterns:
-        if re.search(pattern, text_lower):
-            return pattern
+# Shared result for every safe message
+_SAFE_RESULT = SafetyCheckResult(
+    is_safe=True,
+    trigger_type=SafetyTriggerType.NONE
+)
+
+
+def _check_patterns(text_lower: str, category: tuple) -> Optional[str]:
+    """
+    Check already-lowercased text against a compiled trigger category.
+    Returns the matched pattern string or None.
+    """
+    gate, patterns = category
+    if not gate.search(text_lower):
+        return None
+    for source, regex in patterns:
+        if regex is None:
+            if source in text_lower:
+                return source
+        elif regex.search(text_lower):
+            return source
     return None
 
 
+@lru_cache(maxsize=2048)
 def check_safety(user_input: str) -> SafetyCheckResult:
     """
     Check user input for safety triggers.
     Returns SafetyCheckResult with trigger type and suggested response.
+    Results are cached per exact input and shared, so treat them as read-only.
     """
     text = user_input.lower().strip()
     
+    # Fast path: tiny greetings / thanks need no pattern scan
+    tokens = text.split()
+    if len(tokens) <= 3 and all(t.strip("!.,?") in TRIVIAL_SAFE_WORDS for t in tokens):
+        return _SAFE_RESULT
+    
+    if not _ANY_TRIGGER_RE.search(text):
+        return _SAFE_RESULT
+    
     # Check each category in order of severity
     
     # 1. Complaints (highest priority - user needs immediate help)
-    if matched := _check_patterns(text, COMPLAINT_PATTERNS):
+    if matched := _check_patterns(text, _COMPLAINT_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.COMPLAINT,
@@ -177,7 +243,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # 2. Explicit handoff requests
-    if matched := _check_patterns(text, HANDOFF_PATTERNS):
+    if matched := _check_patterns(text, _HANDOFF_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.HANDOFF_REQUEST,
@@ -187,7 +253,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # 3. Legal matters
-    if matched := _check_patterns(text, LEGAL_PATTERNS):
+    if matched := _check_patterns(text, _LEGAL_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.LEGAL_MATTER,
@@ -197,7 +263,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # 4. High value investments
-    if matched := _check_patterns(text, HIGH_VALUE_PATTERNS):
+    if matched := _check_patterns(text, _HIGH_VALUE_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.HIGH_VALUE,
@@ -207,7 +273,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # 5. Tax advisory
-    if matched := _check_patterns(text, TAX_PATTERNS):
+    if matched := _check_patterns(text, _TAX_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.TAX_ADVISORY,
@@ -217,7 +283,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # 6. Advisory boundary (specific recommendations)
-    if matched := _check_patterns(text, ADVISORY_PATTERNS):
+    if matched := _check_patterns(text, _ADVISORY_RES):
         return SafetyCheckResult(
             is_safe=False,
             trigger_type=SafetyTriggerType.ADVISORY_BOUNDARY,
@@ -227,10 +293,7 @@ def check_safety(user_input: str) -> SafetyCheckResult:
         )
     
     # All clear
-    return SafetyCheckResult(
-        is_safe=True,
-        trigger_type=SafetyTriggerType.NONE
-    )
+    return _SAFE_RESULT
 
 
 def inject_disclaimer(response: str, has_projection: bool = False, has_calculation: bool = False) -> str:
@@ -257,46 +320,103 @@ def inject_disclaimer(response: str, has_projection: bool = False, has_calculati
     return response
 
 
+# Response-side disclaimer indicators (matched against the lowercased response)
+_PROJECTION_RE = re.compile("|".join((
+    r"₹[\d,]+\s*(lakh|crore)",  # Amount projections
+    r"\d+\s*%\s*(return|growth)",  # Return percentages
+    r"after\s+\d+\s+years?",  # Future timeframes
+    r"\d+\s+saal\s+(baad|mein)",  # Hindi future timeframes
+    r"ban\s+(sakte|jayenge|sakta)",  # "will become" phrases
+    r"ho\s+(sakte|jayenge|sakta)",  # "can be" phrases
+    r"mil\s+(sakte|jayenge|sakta)",  # "can get" phrases
+)))
+
+_CALCULATION_RES = (
+    re.compile(r"₹[\d,]+"),  # Any rupee amount
+    re.compile(r"\d+\s*%"),  # Any percentage
+    re.compile(r"(calculate|calculation|formula)"),
+    re.compile(r"(total|sum|corpus)"),
+)
+
+
 def detect_projection_in_response(response: str) -> bool:
     """Check if response contains financial projections that need disclaimer."""
-    projection_indicators = [
-        r"₹[\d,]+\s*(lakh|crore)",  # Amount projections
-        r"\d+\s*%\s*(return|growth)",  # Return percentages
-        r"after\s+\d+\s+years?",  # Future timeframes
-        r"\d+\s+saal\s+(baad|mein)",  # Hindi future timeframes
-        r"ban\s+(sakte|jayenge|sakta)",  # "will become" phrases
-        r"ho\s+(sakte|jayenge|sakta)",  # "can be" phrases
-        r"mil\s+(sakte|jayenge|sakta)",  # "can get" phrases
-    ]
-    
-    response_lower = response.lower()
-    for pattern in projection_indicators:
-        if re.search(pattern, response_lower):
-            return True
-    return False
+    return _PROJECTION_RE.search(response.lower()) is not None
 
 
 def detect_calculation_in_response(response: str) -> bool:
     """Check if response contains calculations that need disclaimer."""
-    calculation_indicators = [
-        r"₹[\d,]+",  # Any rupee amount
-        r"\d+\s*%",  # Any percentage
-        r"(calculate|calculation|formula)",
-        r"(total|sum|corpus)",
-    ]
-    
     response_lower = response.lower()
     matches = 0
-    for pattern in calculation_indicators:
-        if re.search(pattern, response_lower):
+    for pattern in _CALCULATION_RES:
+        if pattern.search(response_lower):
             matches += 1
+            # Need at least 2 indicators to consider it a calculation
+            if matches >= 2:
+                return True
+    return False
+
+
+# Projection + calculation indicators fused into one zero-width scan.
+# Lookaheads consume nothing, so every start position is tried; where two
+# groups overlap (₹ lakh amount / % return) the projection group implies
+# the matching calculation group, see _IMPLIED_CALC_FLAGS.
+_RESPONSE_FLAGS_RE = re.compile(
+    r"(?=(?:"
+    r"(?P<proj_amount>₹[\d,]+\s*(?:lakh|crore))"
+    r"|(?P<proj_return>\d+\s*%\s*(?:return|growth))"
+    r"|(?P<proj_after>after\s+\d+\s+years?)"
+    r"|(?P<proj_saal>\d+\s+saal\s+(?:baad|mein))"
+    r"|(?P<proj_ban>ban\s+(?:sakte|jayenge|sakta))"
+    r"|(?P<proj_ho>ho\s+(?:sakte|jayenge|sakta))"
+    r"|(?P<proj_mil>mil\s+(?:sakte|jayenge|sakta))"
+    r"|(?P<calc_amount>₹[\d,]+)"
+    r"|(?P<calc_percent>\d+\s*%)"
+    r"|(?P<calc_word>calculate|calculation|formula)"
+    r"|(?P<calc_total>total|sum|corpus)"
+    r"))"
+)
+
+_IMPLIED_CALC_FLAGS = {
+    "proj_amount": "calc_amount",
+    "proj_return": "calc_percent",
+}
+
+
+def detect_flags_in_response(response: str) -> tuple[bool, bool]:
+    """
+    Single-pass equivalent of detect_projection_in_response and
+    detect_calculation_in_response.
+    
+    Returns:
+        (has_projection, has_calculation)
+    """
+    has_projection = False
+    calc_flags = set()
+    
+    for match in _RESPONSE_FLAGS_RE.finditer(response.lower()):
+        group = match.lastgroup
+        if group.startswith("proj_"):
+            has_projection = True
+            implied = _IMPLIED_CALC_FLAGS.get(group)
+            if implied:
+                calc_flags.add(implied)
+        else:
+            calc_flags.add(group)
+        
+        if has_projection and len(calc_flags) >= 2:
+            break
     
     # Need at least 2 indicators to consider it a calculation
-    return matches >= 2
+    return has_projection, len(calc_flags) >= 2
 
 
+@lru_cache(maxsize=1024)
 def format_handoff_response(trigger_type: SafetyTriggerType, user_name: Optional[str] = None) -> str:
-    """Get formatted handoff response with user name."""
+    """
+    Get formatted handoff response with user name.
+    Cached per (trigger, name), so each user's text is formatted once.
+    """
     name = user_name or "Aap"
     template = HANDOFF_RESPONSES.get(trigger_type, HANDOFF_RESPONSES[SafetyTriggerType.HANDOFF_REQUEST])
     return template.format(name=name)
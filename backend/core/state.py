@@ -3,12 +3,20 @@ Session state model for SamairaAI conversations.
 Tracks user context, goals, preferences, and conversation history.
 """
 
+import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Literal
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-import uuid
+import secrets
+import time
+
+
+# Messages kept per session; older ones are dropped as new ones arrive
+MAX_HISTORY_MESSAGES = 256
 
 
 class GoalType(str, Enum):
@@ -40,22 +48,22 @@ class ConversationPhase(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Single message in conversation history."""
     role: Literal["user", "assistant", "system"]
     content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
     
     def to_dict(self) -> dict:
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserGoal:
     """Structured representation of a user's financial goal."""
     goal_type: GoalType
@@ -82,9 +90,9 @@ class SessionState:
     Complete session state for a user conversation.
     Maintains context across multiple turns.
     """
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str = field(default_factory=lambda: secrets.token_hex(16))  # 128-bit random id
     created_at: datetime = field(default_factory=datetime.now)
-    last_active: datetime = field(default_factory=datetime.now)
+    last_active: float = field(default_factory=time.time)  # Epoch seconds
     
     # User identification
     user_name: Optional[str] = None
@@ -98,8 +106,12 @@ class SessionState:
     preferred_language: str = "hinglish"  # hinglish, hindi, english
     
     # Conversation tracking
-    conversation_history: list[Message] = field(default_factory=list)
+    conversation_history: deque[Message] = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY_MESSAGES)
+    )
+    turn_count: int = 0                   # User messages so far (survives history trimming)
     detected_intents: list[str] = field(default_factory=list)
+    detected_intents_set: set[str] = field(default_factory=set, repr=False)  # O(1) dedup for detected_intents
     topics_discussed: list[str] = field(default_factory=list)
     
     # Safety flags
@@ -110,21 +122,41 @@ class SessionState:
     
     def add_message(self, role: Literal["user", "assistant", "system"], content: str):
         """Add a message to conversation history."""
-        self.conversation_history.append(Message(role=role, content=content))
-        self.last_active = datetime.now()
+        self.add_messages([(role, content)])
+    
+    def add_messages(self, items: list[tuple[str, str]]):
+        """
+        Add several (role, content) messages in one go.
+        Bookkeeping (timestamp) runs once for the whole batch.
+        """
+        now = time.time()
+        self.conversation_history.extend(
+            Message(role=role, content=content, timestamp=now) for role, content in items
+        )
+        self.turn_count += sum(1 for role, _ in items if role == "user")
+        self.last_active = now
+    
+    def add_detected_intent(self, intent: str):
+        """Record an intent once, keeping first-seen order."""
+        if intent not in self.detected_intents_set:
+            self.detected_intents_set.add(intent)
+            self.detected_intents.append(intent)
+    
+    def _last_messages(self, n: int):
+        """Iterate over the last n messages, oldest first."""
+        history = self.conversation_history
+        return islice(history, max(0, len(history) - n), None)
     
     def get_recent_history(self, n: int = 10) -> list[dict]:
         """Get last n messages for context."""
-        recent = self.conversation_history[-n:] if len(self.conversation_history) > n else self.conversation_history
-        return [msg.to_dict() for msg in recent]
+        return [msg.to_dict() for msg in self._last_messages(n)]
     
     def get_conversation_history(self, n: int = 10) -> list[dict]:
         """
         Get conversation history in a simple format for LLM context.
         Returns list of {role, content} dicts.
         """
-        messages = self.conversation_history[-n:] if len(self.conversation_history) > n else self.conversation_history
-        return [{"role": msg.role, "content": msg.content} for msg in messages]
+        return [{"role": msg.role, "content": msg.content} for msg in self._last_messages(n)]
     
     def get_gemini_history(self, n: int = 10) -> list[dict]:
         """
@@ -132,9 +164,7 @@ class SessionState:
         Returns the last n message pairs for context continuity.
         """
         history = []
-        messages = self.conversation_history[-n*2:] if len(self.conversation_history) > n*2 else self.conversation_history
-        
-        for msg in messages:
+        for msg in self._last_messages(n * 2):
             role = "model" if msg.role == "assistant" else msg.role
             if role in ["user", "model"]:  # Skip system messages
                 history.append({
@@ -189,7 +219,7 @@ class SessionState:
         return {
             "session_id": self.session_id,
             "created_at": self.created_at.isoformat(),
-            "last_active": self.last_active.isoformat(),
+            "last_active": datetime.fromtimestamp(self.last_active).isoformat(),
             "user_name": self.user_name,
             "current_phase": self.current_phase.value,
             "current_goal": self.current_goal.to_dict() if self.current_goal else None,
@@ -212,6 +242,7 @@ class SessionStore:
     
     def __init__(self):
         self._sessions: dict[str, SessionState] = {}
+        self._save_pending = False
         self._storage_path = Path(__file__).parent.parent / "data" / "sessions.json"
         self._storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._load_sessions()
@@ -233,6 +264,9 @@ class SessionStore:
                             session.conversation_history.append(
                                 Message(role=msg['role'], content=msg['content'])
                             )
+                        session.turn_count = sum(
+                            1 for msg in session.conversation_history if msg.role == "user"
+                        )
                         self._sessions[sid] = session
                 print(f"[OK] Loaded {len(self._sessions)} sessions from disk")
             except Exception as e:
@@ -250,7 +284,7 @@ class SessionStore:
                     'risk_preference': session.risk_preference.value if session.risk_preference else None,
                     'conversation_history': [
                         {'role': msg.role, 'content': msg.content}
-                        for msg in session.conversation_history[-30:]  # Keep last 30 messages
+                        for msg in session._last_messages(30)  # Keep last 30 messages
                     ]
                 }
             with open(self._storage_path, 'w', encoding='utf-8') as f:
@@ -258,11 +292,32 @@ class SessionStore:
         except Exception as e:
             print(f"[WARNING] Could not save sessions: {e}")
     
+    def _request_save(self):
+        """
+        Persist sessions on the next event-loop tick.
+        Changes made in the same tick share one write; outside a running
+        loop (scripts, tests) the write happens immediately.
+        """
+        if self._save_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_sessions()
+            return
+        self._save_pending = True
+        loop.call_soon(self._flush_sessions)
+    
+    def _flush_sessions(self):
+        """Write out sessions queued by _request_save."""
+        self._save_pending = False
+        self._save_sessions()
+    
     def create_session(self) -> SessionState:
         """Create a new session."""
         session = SessionState()
         self._sessions[session.session_id] = session
-        self._save_sessions()
+        self._request_save()
         return session
     
     def get_session(self, session_id: str) -> Optional[SessionState]:
@@ -273,7 +328,7 @@ class SessionStore:
         """Get existing session or create new one."""
         if session_id and session_id in self._sessions:
             session = self._sessions[session_id]
-            session.last_active = datetime.now()
+            session.last_active = time.time()
             return session
         # Create new session but preserve the session_id if provided
         session = SessionState()
@@ -282,33 +337,33 @@ class SessionStore:
             # Create session with client's ID to maintain continuity
             session = SessionState(session_id=session_id)
         self._sessions[session.session_id] = session
-        self._save_sessions()
+        self._request_save()
         return session
     
     def update_session(self, session: SessionState):
         """Mark session as updated and persist."""
-        session.last_active = datetime.now()
-        self._save_sessions()
+        session.last_active = time.time()
+        self._request_save()
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
         if session_id in self._sessions:
             del self._sessions[session_id]
-            self._save_sessions()
+            self._request_save()
             return True
         return False
     
     def cleanup_expired(self, timeout_minutes: int = 30):
         """Remove sessions older than timeout."""
-        now = datetime.now()
+        now = time.time()
         expired = [
             sid for sid, session in self._sessions.items()
-            if (now - session.last_active).total_seconds() > timeout_minutes * 60
+            if now - session.last_active > timeout_minutes * 60
         ]
         for sid in expired:
             del self._sessions[sid]
         if expired:
-            self._save_sessions()
+            self._request_save()
         return len(expired)
 
 
@@ -4,7 +4,9 @@ All calculations are illustrative and use hardcoded/configurable rates.
 NO LLM involvement in math — pure deterministic logic.
 """
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
 
@@ -31,9 +33,18 @@ DEFAULT_RATES = {
 }
 
 
-@dataclass
+# Compounding periods per year for FD calculations
+COMPOUND_FREQ = {
+    "monthly": 12,
+    "quarterly": 4,
+    "half-yearly": 2,
+    "yearly": 1
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectionResult:
-    """Result of a financial projection calculation."""
+    """Result of a financial projection calculation (immutable; calculators cache results)."""
     investment_type: InvestmentType
     monthly_investment: float
     tenure_years: int
@@ -72,6 +83,19 @@ class ProjectionResult:
         )
 
 
+@lru_cache(maxsize=1024)
+def _sip_factor(monthly_rate: float, months: int) -> float:
+    """
+    Maturity of a 1-rupee monthly SIP: ({[1 + r]^n – 1} / r) × (1 + r).
+    Shared by the forward (SIP) and reverse (goal corpus) calculations,
+    which are usually run with the same few rate/tenure combinations.
+    """
+    if monthly_rate > 0:
+        return (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
+    return months
+
+
+@lru_cache(maxsize=1024)
 def calculate_sip(
     monthly_amount: float,
     years: int,
@@ -91,10 +115,7 @@ def calculate_sip(
     months = years * 12
     
     # SIP Future Value formula
-    if monthly_rate > 0:
-        maturity = monthly_amount * (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
-    else:
-        maturity = monthly_amount * months
+    maturity = monthly_amount * _sip_factor(monthly_rate, months)
     
     total_invested = monthly_amount * months
     total_returns = maturity - total_invested
@@ -112,6 +133,75 @@ def calculate_sip(
     )
 
 
+def calculate_sip_batch(
+    monthly_amounts,
+    years,
+    annual_rates=DEFAULT_RATES[InvestmentType.SIP]
+) -> dict:
+    """
+    Vectorized SIP projection for many (amount, years, rate) scenarios at once.
+    Arguments are broadcastable arrays (or scalars); the formula matches
+    calculate_sip. Returns a dict of NumPy arrays, for what-if sweeps.
+    """
+    import numpy as np  # Only needed for bulk projections
+    
+    monthly_amounts = np.asarray(monthly_amounts, dtype=float)
+    monthly_rate = np.asarray(annual_rates, dtype=float) / 12 / 100
+    months = np.asarray(years) * 12
+    
+    total_invested = monthly_amounts * months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        maturity = np.where(
+            monthly_rate > 0,
+            monthly_amounts * (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate),
+            total_invested
+        )
+        total_returns = maturity - total_invested
+        returns_pct = np.where(total_invested > 0, total_returns / total_invested * 100, 0.0)
+    
+    return {
+        "total_invested": total_invested,
+        "maturity_value": maturity,
+        "total_returns": total_returns,
+        "returns_percentage": returns_pct,
+    }
+
+
+def _rd_growth_sum(months: int, quarterly_rate: float) -> float:
+    """
+    Sum of growth factors for monthly RD deposits with quarterly compounding.
+    The deposit made with k months left grows by (1 + r)^(k/3), so the sum
+    is the geometric series x + x^2 + ... + x^months with x = (1 + r)^(1/3).
+    Pure numeric kernel, kept apart from result construction.
+    """
+    if months <= 0:
+        return 0
+    # log of x; expm1 keeps (x^n - 1)/(x - 1) accurate at low rates
+    log_growth = math.log1p(quarterly_rate) / 3
+    if log_growth == 0:
+        return months
+    return math.exp(log_growth) * math.expm1(months * log_growth) / math.expm1(log_growth)
+
+
+def _yearly_growth_sum(deposit_years: int, years: int, annual_rate: float) -> float:
+    """
+    Sum of growth factors for yearly deposits compounding annually.
+    Deposits are made in each of the first deposit_years years and all mature
+    at the end of year `years`, so the deposit made in year y grows by
+    g^(years - y) with g = 1 + rate. Closed-form geometric series.
+    """
+    if deposit_years <= 0:
+        return 0
+    log_growth = math.log1p(annual_rate / 100)
+    if log_growth == 0:
+        return deposit_years
+    return (
+        math.exp((years - deposit_years + 1) * log_growth)
+        * math.expm1(deposit_years * log_growth) / math.expm1(log_growth)
+    )
+
+
+@lru_cache(maxsize=1024)
 def calculate_rd(
     monthly_amount: float,
     years: int,
@@ -131,10 +221,7 @@ def calculate_rd(
     months = years * 12
     
     # Simplified RD calculation (monthly deposit, quarterly compound)
-    maturity = 0
-    for month in range(months):
-        quarters_remaining = (months - month) / 3
-        maturity += monthly_amount * ((1 + quarterly_rate) ** quarters_remaining)
+    maturity = monthly_amount * _rd_growth_sum(months, quarterly_rate)
     
     total_invested = monthly_amount * months
     total_returns = maturity - total_invested
@@ -152,6 +239,7 @@ def calculate_rd(
     )
 
 
+@lru_cache(maxsize=1024)
 def calculate_fd(
     principal: float,
     years: int,
@@ -163,13 +251,7 @@ def calculate_fd(
     
     Formula: A = P(1 + r/n)^(nt)
     """
-    compound_freq = {
-        "monthly": 12,
-        "quarterly": 4,
-        "half-yearly": 2,
-        "yearly": 1
-    }
-    n = compound_freq.get(compounding, 4)
+    n = COMPOUND_FREQ.get(compounding, 4)
     
     maturity = principal * ((1 + annual_rate / (100 * n)) ** (n * years))
     total_returns = maturity - principal
@@ -187,6 +269,7 @@ def calculate_fd(
     )
 
 
+@lru_cache(maxsize=1024)
 def calculate_ppf(
     yearly_amount: float,
     years: int = 15,  # PPF has 15-year lock-in
@@ -196,10 +279,7 @@ def calculate_ppf(
     Calculate PPF maturity value.
     PPF compounds annually, max 15 years initial term.
     """
-    maturity = 0
-    for year in range(years):
-        years_to_mature = years - year
-        maturity += yearly_amount * ((1 + annual_rate / 100) ** years_to_mature)
+    maturity = yearly_amount * _yearly_growth_sum(years, years, annual_rate)
     
     total_invested = yearly_amount * years
     total_returns = maturity - total_invested
@@ -220,6 +300,7 @@ def calculate_ppf(
     )
 
 
+@lru_cache(maxsize=1024)
 def calculate_ssy(
     yearly_amount: float,
     years: int = 21,  # SSY matures when girl turns 21
@@ -231,10 +312,7 @@ def calculate_ssy(
     """
     deposit_years = min(years, 15)  # Can only deposit for 15 years
     
-    maturity = 0
-    for year in range(deposit_years):
-        years_to_mature = years - year
-        maturity += yearly_amount * ((1 + annual_rate / 100) ** years_to_mature)
+    maturity = yearly_amount * _yearly_growth_sum(deposit_years, years, annual_rate)
     
     total_invested = yearly_amount * deposit_years
     total_returns = maturity - total_invested
@@ -300,12 +378,7 @@ def calculate_goal_corpus(
     months = years * 12
     
     # Required monthly investment formula (reverse of SIP)
-    if monthly_rate > 0:
-        required_monthly = target_amount / (
-            (((1 + monthly_rate) ** months - 1) / monthly_rate) * (1 + monthly_rate)
-        )
-    else:
-        required_monthly = target_amount / months
+    required_monthly = target_amount / _sip_factor(monthly_rate, months)
     
     total_investment = required_monthly * months
     
@@ -179,13 +179,24 @@ def get_all_goal_templates() -> list[GoalTemplate]:
     return list(GOAL_TEMPLATES.values())
 
 
+# Inflation factors for each template's (inflation_rate, typical timeline),
+# precomputed once; other combinations are computed on the fly
+_INFLATION_FACTORS = {
+    (t.inflation_rate, t.typical_timeline_years): (1 + t.inflation_rate / 100) ** t.typical_timeline_years
+    for t in GOAL_TEMPLATES.values()
+}
+
+
 def estimate_future_cost(
     current_cost_lakhs: float,
     years: int,
     inflation_rate: float
 ) -> float:
     """Estimate future cost considering inflation."""
-    return current_cost_lakhs * ((1 + inflation_rate / 100) ** years)
+    factor = _INFLATION_FACTORS.get((inflation_rate, years))
+    if factor is None:
+        factor = (1 + inflation_rate / 100) ** years
+    return current_cost_lakhs * factor
 
 
 def generate_goal_summary(
@@ -270,9 +281,10 @@ def suggest_instruments_for_goal(goal_type: str, timeline_years: int) -> list[st
         return base_instruments
 
 
-def detect_goal_from_text(text: str) -> Optional[str]:
-    """Detect goal type from user's Hinglish text."""
-    text_lower = text.lower()
+def detect_goal_from_text(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Detect goal type from user's Hinglish text (pass text_lower if already computed)."""
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Education keywords
     if any(kw in text_lower for kw in ["padhai", "education", "college", "school", "bachhe", "bachha", "beta", "beti", "study"]):
@@ -4,7 +4,9 @@ Curated, citation-backed knowledge for RAG-lite retrieval.
 Provides authoritative context to ground LLM responses.
 """
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
@@ -521,6 +523,29 @@ class FinancialKnowledgeBase:
     
     def __init__(self):
         self._articles = KNOWLEDGE_BASE
+        # Lowercased match fields per article, built once instead of per query
+        self._search_index = [
+            (
+                article,
+                tuple(article.keywords),
+                article.title.lower(),
+                tuple(q.lower() for q in article.common_questions),
+            )
+            for article in self._articles.values()
+        ]
+        # Exact prefilter over the whole KB: a query that hits none of these
+        # cannot score > 0 for any article, so search() returns early.
+        # Words never contain whitespace, so "\n" keeps matches per field.
+        all_keywords = {kw for _, keywords, _, _ in self._search_index for kw in keywords}
+        self._keyword_re = re.compile(
+            "|".join(map(re.escape, sorted(all_keywords, key=len, reverse=True)))
+        ) if all_keywords else None
+        self._title_corpus = "\n".join(title for _, _, title, _ in self._search_index)
+        self._question_corpus = "\n".join(
+            q for _, _, _, questions in self._search_index for q in questions
+        )
+        # Articles are static, so context for a given query never changes
+        self._cached_context = lru_cache(maxsize=512)(self._build_context)
     
     def search(self, query: str, top_k: int = 3) -> List[KBArticle]:
         """
@@ -528,24 +553,31 @@ class FinancialKnowledgeBase:
         Simple keyword matching (can be upgraded to embeddings later).
         """
         query_lower = query.lower()
+        words = query_lower.split()
+        long_words = [word for word in words if len(word) > 3]
+        
+        if not self._might_match(query_lower, words, long_words):
+            return []
+        
         scores = []
         
-        for article_id, article in self._articles.items():
+        for article, keywords, title_lower, questions_lower in self._search_index:
             score = 0
             
             # Keyword matching
-            for keyword in article.keywords:
+            for keyword in keywords:
                 if keyword in query_lower:
                     score += 2
             
             # Title matching
-            if any(word in article.title.lower() for word in query_lower.split()):
+            if any(word in title_lower for word in words):
                 score += 1
             
             # Common question matching
-            for question in article.common_questions:
-                if any(word in question.lower() for word in query_lower.split() if len(word) > 3):
-                    score += 1
+            if long_words:
+                for question in questions_lower:
+                    if any(word in question for word in long_words):
+                        score += 1
             
             if score > 0:
                 scores.append((score, article))
@@ -554,6 +586,14 @@ class FinancialKnowledgeBase:
         scores.sort(key=lambda x: x[0], reverse=True)
         return [article for _, article in scores[:top_k]]
     
+    def _might_match(self, query_lower: str, words: List[str], long_words: List[str]) -> bool:
+        """Whether any article could score for this query (no false negatives)."""
+        if self._keyword_re is not None and self._keyword_re.search(query_lower):
+            return True
+        if any(word in self._title_corpus for word in words):
+            return True
+        return any(word in self._question_corpus for word in long_words)
+    
     def get_article(self, article_id: str) -> Optional[KBArticle]:
         """Get specific article by ID."""
         return self._articles.get(article_id)
@@ -565,7 +605,13 @@ class FinancialKnowledgeBase:
     def get_context_for_query(self, query: str, include_full_content: bool = False) -> str:
         """
         Get formatted context for LLM from relevant articles.
+        Cached on the lowercased, whitespace-collapsed query.
         """
+        normalized = " ".join(query.lower().split())
+        return self._cached_context(normalized, include_full_content)
+    
+    def _build_context(self, query: str, include_full_content: bool) -> str:
+        """Build LLM context for a normalized query (see get_context_for_query)."""
         articles = self.search(query, top_k=2)
         
         if not articles:
@@ -215,13 +215,8 @@ def format_scheme_comparison(scheme_codes: list[str]) -> str:
     return "\n".join(lines)
 
 
-def get_scheme_explanation_hinglish(scheme_code: str) -> str:
-    """Get a Hinglish explanation of a scheme."""
-    scheme = SCHEMES.get(scheme_code.lower())
-    
-    if not scheme:
-        return "Yeh scheme mere database mein nahi hai."
-    
+def _format_scheme_explanation(scheme: GovernmentScheme) -> str:
+    """Render the Hinglish explanation for a scheme."""
     features = "\n".join([f"  • {f}" for f in scheme.key_features[:4]])
     
     return f"""**{scheme.name}** ({scheme.name_hindi})
@@ -236,3 +231,17 @@ def get_scheme_explanation_hinglish(scheme_code: str) -> str:
 **Tax Benefit:** {scheme.tax_benefit}
 
 *Yeh information educational purpose ke liye hai. Scheme rules change ho sakte hain.*"""
+
+
+# Explanations only depend on the static SCHEMES table, so render them once
+_SCHEME_EXPLANATIONS = {
+    code: _format_scheme_explanation(scheme) for code, scheme in SCHEMES.items()
+}
+
+
+def get_scheme_explanation_hinglish(scheme_code: str) -> str:
+    """Get a Hinglish explanation of a scheme."""
+    return _SCHEME_EXPLANATIONS.get(
+        scheme_code.lower(),
+        "Yeh scheme mere database mein nahi hai."
+    )
@@ -143,6 +143,11 @@ async def lifespan(app: FastAPI):
     
     # SHUTDOWN
     logger.info("🪷 Shutting down SamairaAI...")
+    try:
+        from services.llm_service import llm_service
+        await llm_service.aclose()
+    except Exception as e:
+        logger.warning(f"⚠️ LLM shutdown failed: {e}")
     uptime = datetime.now() - app_state["start_time"]
     logger.info(f"📊 Stats: {app_state['request_count']} requests, {app_state['error_count']} errors, uptime {uptime}")
 
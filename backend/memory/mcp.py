@@ -156,6 +156,10 @@ class MCPMemory:
         self.storage = memory_storage
         self._cache: Dict[str, MemoryContext] = {}
     
+    def has_context(self, session_id: str) -> bool:
+        """Whether a session's memory context is already loaded."""
+        return session_id in self._cache
+    
     def get_context(self, session_id: str) -> MemoryContext:
         """
         Get or create memory context for a session.
@@ -274,6 +278,19 @@ class MCPMemory:
         
         return context
     
+    def process_turns(self, turns: List[Tuple[str, str, str]]):
+        """
+        Process several (session_id, user_message, ai_response) turns
+        with a single storage commit.
+        A failing turn is logged and skipped; the commit still covers the rest.
+        """
+        with self.storage.batch():
+            for session_id, user_message, ai_response in turns:
+                try:
+                    self.process_turn(session_id, user_message, ai_response)
+                except Exception as e:
+                    print(f"[WARNING] MCP memory processing error ({session_id}): {e}")
+    
     def _extract_facts(self, message: str) -> List[Tuple[str, str, Any]]:
         """Extract structured facts from a message."""
         facts = []
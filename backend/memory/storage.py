@@ -6,6 +6,7 @@ Stores episodic facts, conversation summaries, and user profiles across sessions
 import sqlite3
 import json
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
@@ -26,6 +27,7 @@ class MemoryStorage:
             db_path = os.path.join(data_dir, 'memory.db')
         
         self.db_path = db_path
+        self._local = threading.local()  # Per-thread connection of an open batch()
         self._init_db()
     
     def _init_db(self):
@@ -89,7 +91,12 @@ class MemoryStorage:
     
     @contextmanager
     def _get_conn(self):
-        """Get database connection with auto-commit."""
+        """Get database connection with auto-commit (joins an open batch)."""
+        batch_conn = getattr(self._local, "batch_conn", None)
+        if batch_conn is not None:
+            yield batch_conn
+            return
+        
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
@@ -98,6 +105,27 @@ class MemoryStorage:
         finally:
             conn.close()
     
+    @contextmanager
+    def batch(self):
+        """
+        Run several operations on one connection with a single commit.
+        Used to flush queued memory writes together; nested calls join the
+        outer batch.
+        """
+        if getattr(self._local, "batch_conn", None) is not None:
+            yield
+            return
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        self._local.batch_conn = conn
+        try:
+            yield
+            conn.commit()
+        finally:
+            self._local.batch_conn = None
+            conn.close()
+    
     # ===== SESSION OPERATIONS =====
     
     def create_or_update_session(
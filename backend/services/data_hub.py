@@ -335,9 +335,9 @@ class FinancialDataHub:
     def inflation_data(self) -> Dict[str, float]:
         return INFLATION_DATA
     
-    def resolve_bank_name(self, query: str) -> Optional[str]:
-        """Resolve bank name/alias to bank code."""
-        query_lower = query.lower().strip()
+    def resolve_bank_name(self, query: str, query_lower: Optional[str] = None) -> Optional[str]:
+        """Resolve bank name/alias to bank code (pass query_lower if already computed)."""
+        query_lower = (query_lower if query_lower is not None else query.lower()).strip()
         for alias, code in BANK_ALIASES.items():
             if alias in query_lower or query_lower in alias:
                 return code
@@ -47,6 +47,7 @@ class GroqClient:
         self._initialized = False
         self._api_key = None
         self._rate_limiter = RateLimiter(max_requests=25, window_seconds=60)
+        self._http: Optional[httpx.AsyncClient] = None
     
     def initialize(self):
         if self._initialized:
@@ -55,6 +56,25 @@ class GroqClient:
         self._system_prompt = self._load_system_prompt()
         self._initialized = True
     
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Shared HTTP client, created on first use.
+        Concurrent chats reuse pooled keep-alive connections instead of
+        paying a TCP + TLS handshake per message.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close pooled connections (call on shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
     def _load_system_prompt(self) -> str:
         prompt_path = settings.PROMPTS_DIR / "system_prompt.txt"
         if prompt_path.exists():
@@ -82,6 +102,41 @@ class GroqClient:
         'आपका', 'तुम्हारा', 'क्या', 'भाई', 'सर', 'मैडम', 'आप', 'तुम',
     }
     
+    # Name patterns, tried in order (compiled once; run on every message and
+    # over the recent history until a name is found)
+    NAME_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.UNICODE) for p in (
+        # English
+        r"(?:my name is|i am|i'm|call me)\s+([A-Za-z]+)",
+        r"^([A-Za-z]+)\s+(?:here|hoon|hu|hai|speaking)$",
+        # Hindi/Hinglish (romanized)
+        r"(?:mera naam|naam hai|main|mera nam)\s+([A-Za-z]+)",
+        r"(?:mai|mein)\s+([A-Za-z]+)\s+(?:hoon|hu|hai)",
+        # Hindi Devanagari, as raw Unicode code points to avoid encoding issues
+        # मेरा = \u092e\u0947\u0930\u093e, नाम = \u0928\u093e\u092e, है = \u0939\u0948
+        # मीरा = \u092e\u0940\u0930\u093e (STT error), मैं = \u092e\u0948\u0902
+        # "मेरा नाम X" / "मीरा नाम X" / "नाम X है"
+        r'(?:\u092e\u0947\u0930\u093e\s*\u0928\u093e\u092e|\u092e\u0940\u0930\u093e\s*\u0928\u093e\u092e|\u092e\u093f\u0930\u093e\s*\u0928\u093e\u092e|\u0928\u093e\u092e)\s+([A-Za-z\u0900-\u097F]+)',
+        # "मैं X हूं" / "मैं X" (मैं = \u092e\u0948\u0902, हूं = \u0939\u0942\u0902)
+        r'\u092e\u0948\u0902\s+([A-Za-z\u0900-\u097F]+)(?:\s+\u0939\u0942\u0902|\s+\u0939\u0942\u0901|\s+\u0939\u0941|$)',
+        # Reverse order: "X नाम है मेरा"
+        r'([A-Za-z\u0900-\u097F]+)\s+\u0928\u093e\u092e\s+\u0939\u0948',
+        # Urdu
+        r'(?:\u0645\u06cc\u0631\u0627\s*\u0646\u0627\u0645|\u0646\u0627\u0645\s*\u06c1\u06d2)\s+([A-Za-z\u0600-\u06FF]+)',
+    ))
+    NAME_WORD_RE = re.compile(r'[A-Za-z\u0900-\u097F\u0600-\u06FF]+')
+    
+    AGE_PATTERNS = (
+        re.compile(r"(?:i am|i'm|meri age|meri umar|age hai|saal ka|saal ki|years old)\s*(\d{1,2})"),
+        re.compile(r"(\d{1,2})\s*(?:saal|years|yr|age)"),
+    )
+    INCOME_PATTERNS = (
+        re.compile(r"(?:earn|salary|income|kamaata|kamata)\s*(?:around|approx|about)?\s*(\d+(?:\.\d+)?)\s*(?:lakh|lac|l)"),
+        re.compile(r"(\d+(?:\.\d+)?)\s*(?:lakh|lac|l)\s*(?:per month|monthly|mahine)"),
+    )
+    SAVINGS_PATTERNS = (
+        re.compile(r"(?:save|saving|bacha|bachata)\s*(?:around|approx|about)?\s*(\d+(?:,\d+)?)"),
+    )
+    
     def _extract_user_info(self, message: str, session) -> None:
         """Extract user info from message and store in session. Supports Hindi, Urdu, and English."""
         msg_lower = message.lower()
@@ -102,12 +157,8 @@ class GroqClient:
         
         # Extract age
         if not hasattr(session, 'user_age') or not session.user_age:
-            age_patterns = [
-                r"(?:i am|i'm|meri age|meri umar|age hai|saal ka|saal ki|years old)\s*(\d{1,2})",
-                r"(\d{1,2})\s*(?:saal|years|yr|age)",
-            ]
-            for pattern in age_patterns:
-                match = re.search(pattern, msg_lower)
+            for pattern in self.AGE_PATTERNS:
+                match = pattern.search(msg_lower)
                 if match:
                     age = int(match.group(1))
                     if 15 <= age <= 80:
@@ -117,12 +168,8 @@ class GroqClient:
         
         # Extract income
         if not hasattr(session, 'user_income') or not session.user_income:
-            income_patterns = [
-                r"(?:earn|salary|income|kamaata|kamata)\s*(?:around|approx|about)?\s*(\d+(?:\.\d+)?)\s*(?:lakh|lac|l)",
-                r"(\d+(?:\.\d+)?)\s*(?:lakh|lac|l)\s*(?:per month|monthly|mahine)",
-            ]
-            for pattern in income_patterns:
-                match = re.search(pattern, msg_lower)
+            for pattern in self.INCOME_PATTERNS:
+                match = pattern.search(msg_lower)
                 if match:
                     income = float(match.group(1))
                     session.user_income = income
@@ -131,11 +178,8 @@ class GroqClient:
         
         # Extract savings capacity
         if not hasattr(session, 'user_savings') or not session.user_savings:
-            savings_patterns = [
-                r"(?:save|saving|bacha|bachata)\s*(?:around|approx|about)?\s*(\d+(?:,\d+)?)",
-            ]
-            for pattern in savings_patterns:
-                match = re.search(pattern, msg_lower)
+            for pattern in self.SAVINGS_PATTERNS:
+                match = pattern.search(msg_lower)
                 if match:
                     savings = int(match.group(1).replace(',', ''))
                     session.user_savings = savings
@@ -153,42 +197,8 @@ class GroqClient:
     
     def _extract_name_multilingual(self, message: str) -> Optional[str]:
         """Extract name from message supporting English, Hindi, and Urdu scripts."""
-        
-        # Pattern set 1: English patterns
-        english_patterns = [
-            r"(?:my name is|i am|i'm|call me)\s+([A-Za-z]+)",
-            r"^([A-Za-z]+)\s+(?:here|hoon|hu|hai|speaking)$",
-        ]
-        
-        # Pattern set 2: Hindi/Hinglish patterns (romanized)
-        hindi_roman_patterns = [
-            r"(?:mera naam|naam hai|main|mera nam)\s+([A-Za-z]+)",
-            r"(?:mai|mein)\s+([A-Za-z]+)\s+(?:hoon|hu|hai)",
-        ]
-        
-        # Pattern set 3: Hindi Devanagari patterns
-        # Using raw Unicode code points to avoid encoding issues
-        # मेरा = \u092e\u0947\u0930\u093e, नाम = \u0928\u093e\u092e, है = \u0939\u0948
-        # मीरा = \u092e\u0940\u0930\u093e (STT error), मैं = \u092e\u0948\u0902
-        devanagari_patterns = [
-            # "मेरा नाम X" / "मीरा नाम X" / "नाम X है"
-            r'(?:\u092e\u0947\u0930\u093e\s*\u0928\u093e\u092e|\u092e\u0940\u0930\u093e\s*\u0928\u093e\u092e|\u092e\u093f\u0930\u093e\s*\u0928\u093e\u092e|\u0928\u093e\u092e)\s+([A-Za-z\u0900-\u097F]+)',
-            # "मैं X हूं" / "मैं X" (मैं = \u092e\u0948\u0902, हूं = \u0939\u0942\u0902)
-            r'\u092e\u0948\u0902\s+([A-Za-z\u0900-\u097F]+)(?:\s+\u0939\u0942\u0902|\s+\u0939\u0942\u0901|\s+\u0939\u0941|$)',
-            # Reverse order: "X नाम है मेरा"
-            r'([A-Za-z\u0900-\u097F]+)\s+\u0928\u093e\u092e\s+\u0939\u0948',
-        ]
-        
-        # Pattern set 4: Urdu patterns  
-        urdu_patterns = [
-            r'(?:\u0645\u06cc\u0631\u0627\s*\u0646\u0627\u0645|\u0646\u0627\u0645\s*\u06c1\u06d2)\s+([A-Za-z\u0600-\u06FF]+)',
-        ]
-        
-        # Try all pattern sets
-        all_patterns = english_patterns + hindi_roman_patterns + devanagari_patterns + urdu_patterns
-        
-        for pattern in all_patterns:
-            match = re.search(pattern, message, re.IGNORECASE | re.UNICODE)
+        for pattern in self.NAME_PATTERNS:
+            match = pattern.search(message)
             if match:
                 name = match.group(1).strip()
                 # Clean and validate
@@ -196,7 +206,7 @@ class GroqClient:
                     return self._normalize_name(name)
         
         # Direct name detection - check if message contains a known name
-        words = re.findall(r'[A-Za-z\u0900-\u097F\u0600-\u06FF]+', message)
+        words = self.NAME_WORD_RE.findall(message)
         for word in words:
             word_lower = word.lower() if word.isascii() else word
             if word_lower in self.COMMON_NAMES or word in self.COMMON_NAMES:
@@ -212,7 +222,7 @@ class GroqClient:
         if name_lower in self.SKIP_WORDS or name in self.SKIP_WORDS:
             return False
         # Must have at least one letter (any script)
-        if not re.search(r'[A-Za-z\u0900-\u097F\u0600-\u06FF]', name):
+        if not self.NAME_WORD_RE.search(name):
             return False
         return True
     
@@ -363,30 +373,29 @@ class GroqClient:
         try:
             self._rate_limiter.record_request()
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.API_URL,
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.MODEL,
-                        "messages": messages,
-                        "temperature": 0.7,
-                        "max_tokens": 500,
-                        "top_p": 0.9
-                    }
-                )
+            response = await self._get_http().post(
+                self.API_URL,
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.MODEL,
+                    "messages": messages,
+                    "temperature": 0.7,
+                    "max_tokens": 500,
+                    "top_p": 0.9
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                # Return raw response - postprocessing happens in conversation.py
+                return data["choices"][0]["message"]["content"]
+            else:
+                print(f"Groq API error {response.status_code}: {response.text}")
+                return self._get_fallback_response(response.text)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    # Return raw response - postprocessing happens in conversation.py
-                    return data["choices"][0]["message"]["content"]
-                else:
-                    print(f"Groq API error {response.status_code}: {response.text}")
-                    return self._get_fallback_response(response.text)
-                    
         except Exception as e:
             print(f"Groq API error: {e}")
             return self._get_fallback_response(str(e))
@@ -409,35 +418,35 @@ class GroqClient:
         try:
             self._rate_limiter.record_request()
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                async with client.stream(
-                    "POST",
-                    self.API_URL,
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.MODEL,
-                        "messages": messages,
-                        "temperature": 0.7,
-                        "max_tokens": 500,
-                        "stream": True
-                    }
-                ) as response:
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data = line[6:]
-                            if data == "[DONE]":
-                                break
-                            try:
-                                import json
-                                chunk = json.loads(data)
-                                delta = chunk["choices"][0].get("delta", {})
-                                if "content" in delta:
-                                    yield delta["content"]
-                            except:
-                                pass
+            async with self._get_http().stream(
+                "POST",
+                self.API_URL,
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.MODEL,
+                    "messages": messages,
+                    "temperature": 0.7,
+                    "max_tokens": 500,
+                    "stream": True
+                },
+                timeout=60.0
+            ) as response:
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        data = line[6:]
+                        if data == "[DONE]":
+                            break
+                        try:
+                            import json
+                            chunk = json.loads(data)
+                            delta = chunk["choices"][0].get("delta", {})
+                            if "content" in delta:
+                                yield delta["content"]
+                        except:
+                            pass
         except Exception as e:
             print(f"Groq streaming error: {e}")
             yield self._get_fallback_response(str(e))
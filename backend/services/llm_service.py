@@ -4,6 +4,7 @@ Supports multiple providers: Groq (free, recommended) and Gemini.
 Now with MCP (Model Context Protocol) memory integration for persistent context.
 """
 
+import asyncio
 from typing import Optional, AsyncGenerator
 from config.settings import settings
 
@@ -15,11 +16,15 @@ class LLMService:
     Injects MCP memory context for persistent conversation memory.
     """
     
+    MEMORY_BATCH_SIZE = 16  # Max queued turns written per storage commit
+    
     def __init__(self):
         self._provider = None
         self._groq_client = None
         self._gemini_client = None
         self._mcp_memory = None
+        self._memory_queue: Optional[asyncio.Queue] = None
+        self._memory_writer: Optional[asyncio.Task] = None
         self._initialized = False
     
     def initialize(self):
@@ -70,19 +75,74 @@ class LLMService:
             print(f"[WARNING] MCP context error: {e}")
             return None
     
+    async def prefetch_memory_context(self, session_id: str):
+        """
+        Load a session's MCP memory (SQLite) off the event loop.
+        Awaited right before chat()/chat_stream(), so a session's first
+        turn reads the database in a worker thread instead of blocking
+        the event loop inside the LLM call. Nothing else runs alongside it.
+        """
+        if not self._initialized:
+            self.initialize()
+        if not self._mcp_memory or self._mcp_memory.has_context(session_id):
+            return
+        
+        try:
+            await asyncio.to_thread(self._mcp_memory.get_context, session_id)
+        except Exception as e:
+            print(f"[WARNING] MCP prefetch error: {e}")
+    
     async def process_memory(self, session_id: str, user_message: str, assistant_response: str):
         """
-        Process a conversation turn through MCP memory.
-        Extracts facts, updates context, and stores for future reference.
+        Queue a conversation turn for MCP memory.
+        A single writer task extracts facts and stores them, flushing every
+        turn queued meanwhile (across sessions) with one SQLite commit.
         """
         if not self._mcp_memory:
             return
         
+        loop = asyncio.get_running_loop()
+        writer = self._memory_writer
+        if writer is None or writer.done() or writer.get_loop() is not loop:
+            self._memory_queue = asyncio.Queue()
+            self._memory_writer = loop.create_task(self._memory_writer_loop(self._memory_queue))
+        self._memory_queue.put_nowait((session_id, user_message, assistant_response))
+    
+    async def _memory_writer_loop(self, queue: asyncio.Queue):
+        """Single writer: drain queued turns in batches of MEMORY_BATCH_SIZE."""
         try:
-            self._mcp_memory.process_turn(session_id, user_message, assistant_response)
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.MEMORY_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                self._write_memory_batch(batch)
+        except asyncio.CancelledError:
+            # Flush whatever is still queued before shutting down
+            remaining = []
+            while not queue.empty():
+                remaining.append(queue.get_nowait())
+            if remaining:
+                self._write_memory_batch(remaining)
+            raise
+    
+    def _write_memory_batch(self, batch: list):
+        try:
+            self._mcp_memory.process_turns(batch)
         except Exception as e:
             print(f"[WARNING] MCP memory processing error: {e}")
     
+    async def aclose(self):
+        """Flush queued memory writes and release network resources (called on shutdown)."""
+        writer = self._memory_writer
+        if writer is not None and not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+        if self._groq_client:
+            await self._groq_client.aclose()
+    
     @property
     def provider(self) -> str:
         """Get current provider name."""
@@ -10,7 +10,8 @@ from backend.financial.calculators import (
     calculate_ppf,
     calculate_ssy,
     compare_sip_vs_rd,
-    calculate_goal_corpus
+    calculate_goal_corpus,
+    calculate_sip_batch
 )
 
 
@@ -51,6 +52,24 @@ class TestSIPCalculator:
         assert ratio > 4
 
 
+class TestSIPBatch:
+    """Tests for the vectorized SIP projection"""
+    
+    def test_batch_matches_scalar(self):
+        """Each scenario in a batch matches calculate_sip"""
+        pytest.importorskip("numpy")
+        amounts = [5000, 10000, 2500.5]
+        years = [10, 1, 20]
+        rates = [12, 0, 8.5]
+        
+        batch = calculate_sip_batch(amounts, years, rates)
+        
+        for i, (amount, year, rate) in enumerate(zip(amounts, years, rates)):
+            single = calculate_sip(amount, year, rate)
+            assert batch["maturity_value"][i] == pytest.approx(single.maturity_value)
+            assert batch["total_invested"][i] == pytest.approx(single.total_invested)
+
+
 class TestRDCalculator:
     """Tests for RD calculator"""
     
@@ -287,5 +287,17 @@ class TestIntentConfidence:
         assert result.confidence < 0.9
 
 
+class TestIntentCaching:
+    """Tests for repeated detection of the same text"""
+    
+    def test_entities_not_shared_between_calls(self):
+        """Mutating one result's entities does not leak into the next call"""
+        first = detect_intent("SIP 5000 for 10 years")
+        first.entities["amount"] = 1
+        
+        second = detect_intent("SIP 5000 for 10 years")
+        assert second.entities["amount"] == 5000
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+"""
+Tests for the semantic response cache
+"""
+
+import pytest
+from backend.core.response_cache import ResponseCache
+
+
+KEY = ResponseCache.make_key("sip_info", {}, "educating")
+
+
+class TestResponseCache:
+    """Tests for near-duplicate lookups"""
+
+    def test_repeated_question_hits(self):
+        """Same question with different casing/punctuation is served from cache"""
+        cache = ResponseCache()
+        cache.store("s1", "sip kya hai", KEY, "SIP ek tarika hai")
+
+        hit = cache.lookup("s1", "SIP kya hai?", KEY)
+        assert hit is not None
+        assert hit.text == "SIP ek tarika hai"
+
+    def test_different_question_misses(self):
+        """Dissimilar questions are not served from cache"""
+        cache = ResponseCache()
+        cache.store("s1", "sip kya hai", KEY, "SIP ek tarika hai")
+
+        assert cache.lookup("s1", "sip kaise band karein", KEY) is None
+
+    def test_key_must_match(self):
+        """Different entities never share a cached reply"""
+        cache = ResponseCache()
+        key_5000 = ResponseCache.make_key("calculate", {"amount": 5000.0}, "calculating")
+        key_6000 = ResponseCache.make_key("calculate", {"amount": 6000.0}, "calculating")
+        cache.store("s1", "calculate sip", key_5000, "5000 ka result")
+
+        assert cache.lookup("s1", "calculate sip", key_6000) is None
+
+    def test_sessions_are_isolated(self):
+        """Replies are never shared across sessions"""
+        cache = ResponseCache()
+        cache.store("s1", "sip kya hai", KEY, "SIP ek tarika hai")
+
+        assert cache.lookup("s2", "sip kya hai", KEY) is None
+
+    def test_expired_entries_are_dropped(self):
+        """Entries older than the TTL are not served"""
+        cache = ResponseCache(ttl_minutes=0)
+        cache.store("s1", "sip kya hai", KEY, "SIP ek tarika hai")
+        cache.ttl_seconds = -1
+
+        assert cache.lookup("s1", "sip kya hai", KEY) is None
+
+    def test_session_limit(self):
+        """Least recently used sessions are evicted beyond the limit"""
+        cache = ResponseCache(max_sessions=2)
+        for sid in ["s1", "s2", "s3"]:
+            cache.store(sid, "sip kya hai", KEY, "reply")
+
+        assert cache.lookup("s1", "sip kya hai", KEY) is None
+        assert cache.lookup("s3", "sip kya hai", KEY) is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])